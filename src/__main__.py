@@ -0,0 +1,5 @@
+"""Advent of Code 2024 - Entry point for python -m src"""
+
+from .runner import main
+
+main()
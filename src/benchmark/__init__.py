@@ -0,0 +1 @@
+"""Advent of Code 2024 - Benchmarks with synthetic inputs of increasing size"""
@@ -0,0 +1,152 @@
+"""Advent of Code 2024 - Seeded generators of synthetic puzzle inputs"""
+
+from collections.abc import Callable
+import random
+
+Generator = Callable[[int, int], list[str]]
+
+
+def day01(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate two columns of size location IDs.
+    """
+    rng = random.Random(seed)
+    return [f"{rng.randrange(10000, 100000)}   {rng.randrange(10000, 100000)}" for _ in range(size)]
+
+
+def day02(size: int, seed: int = 0, max_levels: int = 8) -> list[str]:
+    """
+    Generate size reports of 5 to max_levels levels, most of them nearly safe.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        level = rng.randrange(40, 60)
+        direction = rng.choice((-1, 1))
+        levels = [level]
+        for _ in range(rng.randrange(4, max_levels)):
+            level += direction * rng.choice((1, 2, 3, 3, 4) if rng.random() < 0.1 else (1, 2, 3))
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return lines
+
+
+def day03(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a corrupted memory line with size instructions mixed with noise.
+    """
+    rng = random.Random(seed)
+    noise = ["mul[3,7]", "mul(32,64]", "!@^", "do_not_", "mul ( 2 , 4 )", "what()", "x"]
+    parts = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.1:
+            parts.append("do()")
+        elif roll < 0.2:
+            parts.append("don't()")
+        elif roll < 0.6:
+            parts.append(f"mul({rng.randrange(1000)},{rng.randrange(1000)})")
+        else:
+            parts.append(rng.choice(noise))
+    return ["".join(parts)]
+
+
+def day04(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a size x size word search grid of the letters X, M, A and S.
+    """
+    rng = random.Random(seed)
+    return ["".join(rng.choice("XMAS") for _ in range(size)) for _ in range(size)]
+
+
+def day05(size: int, seed: int = 0, pages: int = 49) -> list[str]:
+    """
+    Generate ordering rules over pages and size updates, about half of them in order.
+    """
+    rng = random.Random(seed)
+    order = rng.sample(range(10, 100), pages)
+    lines = [
+        f"{order[i]}|{order[j]}" for i in range(pages) for j in range(i + 1, pages)
+    ]
+    rng.shuffle(lines)
+    lines.append("")
+    for _ in range(size):
+        update = rng.sample(order, rng.randrange(3, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=order.index)
+        lines.append(",".join(map(str, update)))
+    return lines
+
+
+def day06(size: int, seed: int = 0, density: float = 0.02, height: int = 0) -> list[str]:
+    """
+    Generate a map size wide and height high, square by default, with the given obstacle
+    density and the guard near the centre.
+    """
+    rng = random.Random(seed)
+    height = height or size
+    grid = [["#" if rng.random() < density else "." for _ in range(size)] for _ in range(height)]
+    grid[height // 2][size // 2] = "^"
+    return ["".join(row) for row in grid]
+
+
+def day07(size: int, seed: int = 0, equations: int = 20) -> list[str]:
+    """
+    Generate equations with size operands each, about half of them solvable.
+
+    The number of operator combinations grows exponentially with the operands, so size
+    is the operand count rather than the number of equations.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(equations):
+        numbers = [rng.randrange(1, 20) for _ in range(size)]
+        target = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.choice(("+", "*", "||"))
+            if operator == "+":
+                target += number
+            elif operator == "*":
+                target *= number
+            else:
+                target = int(f"{target}{number}")
+        if rng.random() < 0.5:
+            target += 1
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return lines
+
+
+def day08(size: int, seed: int = 0, frequencies: int = 10, antennas: int = 4) -> list[str]:
+    """
+    Generate a size x size map with a few antennas of each frequency.
+    """
+    rng = random.Random(seed)
+    grid = [["."] * size for _ in range(size)]
+    symbols = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    for symbol in symbols[:frequencies]:
+        for _ in range(antennas):
+            grid[rng.randrange(size)][rng.randrange(size)] = symbol
+    return ["".join(row) for row in grid]
+
+
+def day09(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a disk map of length size.
+    """
+    rng = random.Random(seed)
+    return [
+        "".join(str(rng.randrange(1, 10) if not i % 2 else rng.randrange(10)) for i in range(size))
+    ]
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+    7: day07,
+    8: day08,
+    9: day09,
+}
@@ -0,0 +1,120 @@
+"""Advent of Code 2024 - Harness timing the day tasks over growing synthetic inputs"""
+
+import argparse
+from collections.abc import Callable, Iterable, Sequence
+import importlib
+import math
+import time
+
+from ..runner import parse_numbers
+from .generators import GENERATORS
+
+DEFAULT_SIZES = [50, 100, 200, 400, 800]
+# Days whose generator size is not the input length, but the operands per equation of day 7
+# whose time grows exponentially with it. Their complexity is reported as O(b^n) and they
+# always use their own sizes, as the sizes of the other days would never finish.
+DAY_SIZES = {7: [4, 6, 8, 10, 12]}
+EXPONENTIAL_DAYS = {7}
+
+
+def time_part(solver: Callable[[Iterable[str]], int], lines: list[str], repeat: int) -> float:
+    """
+    Return the best wall time of repeat runs of the solver over the lines.
+    """
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solver(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def estimate_exponent(samples: Sequence[tuple[int, float]]) -> float | None:
+    """
+    Estimate k in time ~ size^k by a least squares fit on the log-log samples.
+    """
+    points = [(math.log(size), math.log(seconds)) for size, seconds in samples if seconds > 0]
+    return fit_slope(points)
+
+
+def estimate_base(samples: Sequence[tuple[int, float]]) -> float | None:
+    """
+    Estimate b in time ~ b^size by a least squares fit on the log-linear samples.
+    """
+    slope = fit_slope([(size, math.log(seconds)) for size, seconds in samples if seconds > 0])
+    return None if slope is None else math.exp(slope)
+
+
+def fit_slope(points: Sequence[tuple[float, float]]) -> float | None:
+    """
+    Return the slope of the least squares line through the points, if there is one.
+    """
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def benchmark(
+    day: int, part: int, sizes: Sequence[int], repeat: int = 1, budget: float = 10.0
+) -> list[tuple[int, float]]:
+    """
+    Time one part of one day for each size, stopping once a run takes longer than budget seconds.
+
+    Returns:
+        list: The (size, seconds) samples that were measured.
+    """
+    module = importlib.import_module(f"{__package__.rsplit('.', 1)[0]}.day{day:02}")
+    solver = module.part_one if part == 1 else module.part_two
+    samples: list[tuple[int, float]] = []
+    for size in sizes:
+        seconds = time_part(solver, GENERATORS[day](size, 0), repeat)
+        samples.append((size, seconds))
+        if seconds > budget:
+            break
+    return samples
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Benchmark the selected days and parts and report their empirical complexity.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description=__doc__)
+    parser.add_argument("--days", type=parse_numbers, default=sorted(GENERATORS),
+                        help="days to benchmark, e.g. 1-9 or 1,3,5 (default: all)")
+    parser.add_argument("--parts", type=parse_numbers, default=[1, 2],
+                        help="parts to benchmark, e.g. 1,2 (default: both)")
+    parser.add_argument("--sizes", type=parse_numbers, default=None,
+                        help=f"input sizes (default: {','.join(map(str, DEFAULT_SIZES))}), "
+                             "day 7 always uses the operand counts 4-12")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per size, the best one is reported (default: 1)")
+    parser.add_argument("--budget", type=float, default=10.0,
+                        help="stop growing the size once a run exceeds this many seconds")
+    args = parser.parse_args(argv)
+
+    missing_days = set(args.days) - set(GENERATORS)
+    if missing_days:
+        parser.error(f"no generator for days: {sorted(missing_days)}")
+    if not set(args.parts) <= {1, 2}:
+        parser.error("parts must be 1 or 2")
+
+    for day in args.days:
+        for part in args.parts:
+            if day in EXPONENTIAL_DAYS or not args.sizes:
+                sizes = DAY_SIZES.get(day, DEFAULT_SIZES)
+            else:
+                sizes = args.sizes
+            samples = benchmark(day, part, sizes, args.repeat, args.budget)
+            timings = ", ".join(f"{size}: {seconds:.4f} s" for size, seconds in samples)
+            if day in EXPONENTIAL_DAYS:
+                base = estimate_base(samples)
+                complexity = "n/a" if base is None else f"O({base:.2f}^n)"
+            else:
+                exponent = estimate_exponent(samples)
+                complexity = "n/a" if exponent is None else f"O(n^{exponent:.2f})"
+            print(f"Day {day:02} part {part}: {complexity} [{timings}]", flush=True)
@@ -1,12 +1,21 @@
 """Advent of Code 2024 - Day 1 tasks"""
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+import heapq
+from itertools import groupby, islice
+from math import isqrt
+import os
+from typing import Any, BinaryIO
+
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str | bytes]) -> int:
     """
     --- Day 1: Historian Hysteria ---
     The Chief Historian is always present for the big Christmas sleigh launch, 
@@ -77,21 +86,9 @@ def part_one(lines: list[str]) -> int:
     Your actual left and right lists contain many location IDs. What is the total distance between
     your lists?
     """
-    total = 0
-    left =[]
-    right = []
-    for line in lines:
-        row_numbers = line.split("  ")
-        left.append(int(row_numbers[0]))
-        right.append(int(row_numbers[1]))
-    left.sort()
-    right.sort()
-
-    for i, left_value in enumerate(left):
-        total += abs(int(left_value) - int(right[i]))
-    return total
+    return total_distance(*parse_columns(lines))
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str | bytes]) -> int:
     """
     --- Part Two ---
     Your analysis only confirmed what everyone feared: the two lists of location IDs are indeed 
@@ -133,19 +130,450 @@ def part_two(lines: list[str]) -> int:
 
     Once again consider your left and right lists. What is their similarity score?
     """
-    total = 0
+    return similarity_score(*parse_columns(lines))
+
+def solve(lines: Iterable[str | bytes]) -> tuple[int, int]:
+    """
+    Solve both parts from a single parse of the lines.
+    """
+    left, right = parse_columns(lines)
+    return total_distance(left, right), similarity_score(left, right)
+
+def parse_columns(lines: Iterable[str | bytes]) -> tuple[list[int], list[int]]:
+    """
+    Parse the left and right columns of location IDs.
+    """
     left =[]
     right = []
-    for line in lines:
-        row_numbers = line.split("  ")
-        left.append(int(row_numbers[0]))
-        right.append(int(row_numbers[1]))
+    with util.phase("day01.parse"):
+        for line in lines:
+            row_numbers = line.split()
+            left.append(int(row_numbers[0]))
+            right.append(int(row_numbers[1]))
+    return left, right
+
+def total_distance(left: list[int], right: list[int]) -> int:
+    """
+    Sum the distances between the pairs of the sorted columns, sorting them in place.
+    """
+    total = 0
+    with util.phase("day01.sort"):
+        left.sort()
+        right.sort()
+
+    with util.phase("day01.distance"):
+        for i, left_value in enumerate(left):
+            total += abs(int(left_value) - int(right[i]))
+    return total
 
-    for left_value in left:
-        total += left_value * right.count(left_value)
+def similarity_score(left: list[int], right: list[int]) -> int:
+    """
+    Sum each left value multiplied by the number of its occurrences in the right column.
+    """
+    total = 0
+    with util.phase("day01.similarity"):
+        for left_value in left:
+            total += left_value * right.count(left_value)
     return total
 
+def part_one_numpy(lines: Iterable[str | bytes]) -> int:
+    """
+    Solve part one with the vectorized NumPy backend.
+    """
+    return total_distance_numpy(*parse_columns_numpy(lines))
+
+def part_two_numpy(lines: Iterable[str | bytes]) -> int:
+    """
+    Solve part two with the vectorized NumPy backend.
+    """
+    return similarity_score_numpy(*parse_columns_numpy(lines))
+
+def solve_numpy(lines: Iterable[str | bytes]) -> tuple[int, int]:
+    """
+    Solve both parts with the vectorized NumPy backend from a single parse.
+    """
+    left, right = parse_columns_numpy(lines)
+    return total_distance_numpy(left, right), similarity_score_numpy(left, right)
+
+def parse_columns_numpy(lines: Iterable[str | bytes]) -> tuple[Any, Any]:
+    """
+    Parse the left and right columns straight into int64 NumPy arrays.
+    """
+    np = util.import_backend("numpy", "the day01 NumPy backend")
+    with util.phase("day01.parse"):
+        text = " ".join(line.decode("ascii") if isinstance(line, bytes) else line for line in lines)
+        columns = np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 2)
+    return columns[:, 0], columns[:, 1]
+
+def total_distance_numpy(left: Any, right: Any) -> int:
+    """
+    Sum the distances between the pairs of the sorted column arrays.
+    """
+    np = util.import_backend("numpy", "the day01 NumPy backend")
+    with util.phase("day01.sort"):
+        left = np.sort(left)
+        right = np.sort(right)
+    with util.phase("day01.distance"):
+        return int(np.abs(left - right).sum())
+
+def similarity_score_numpy(left: Any, right: Any) -> int:
+    """
+    Compute the similarity score by joining the left array on the counts of the right values.
+    """
+    np = util.import_backend("numpy", "the day01 NumPy backend")
+    with util.phase("day01.similarity"):
+        values, counts = np.unique(right, return_counts=True)
+        if not values.size:
+            return 0
+        indices = np.minimum(np.searchsorted(values, left), len(values) - 1)
+        found = values[indices] == left
+        return int((left[found] * counts[indices[found]]).sum())
+
+EXTERNAL_CHUNK_SIZE = 1_000_000
+# At most EXTERNAL_FAN_IN runs are open in a merge, sharing a read buffer of
+# EXTERNAL_BUFFER_SIZE int64 values, so file handles and memory do not grow with the input.
+EXTERNAL_FAN_IN = 64
+EXTERNAL_BUFFER_SIZE = 1_048_576
+
+def part_one_external(lines: Iterable[str | bytes], chunk_size: int = EXTERNAL_CHUNK_SIZE) -> int:
+    """
+    Solve part one with an external merge sort, for columns larger than the memory.
+    """
+    return solve_external(lines, chunk_size)[0]
+
+def part_two_external(lines: Iterable[str | bytes], chunk_size: int = EXTERNAL_CHUNK_SIZE) -> int:
+    """
+    Solve part two with a merge-join over externally sorted columns.
+    """
+    return solve_external(lines, chunk_size)[1]
+
+def solve_external(
+    lines: Iterable[str | bytes],
+    chunk_size: int = EXTERNAL_CHUNK_SIZE,
+    fan_in: int = EXTERNAL_FAN_IN,
+) -> tuple[int, int]:
+    """
+    Solve both parts holding at most chunk_size rows of the columns in memory.
+
+    The lines are consumed in chunks that are sorted and spilled to temporary files as
+    runs of int64 values. The runs of each column are merged fan_in at a time into longer
+    runs until at most fan_in are left. The left and right runs are then k-way merged in
+    lockstep to sum the distances, and merged once more to join the value counts of both
+    columns for the similarity score.
+    """
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory(prefix="day01-") as directory:
+        left_runs, right_runs = spill_sorted_runs(lines, chunk_size, directory)
+        with util.phase("day01.sort"):
+            left_runs = reduce_runs(left_runs, fan_in)
+            right_runs = reduce_runs(right_runs, fan_in)
+
+        distance = 0
+        with util.phase("day01.distance"):
+            for left_value, right_value in zip(merge_runs(left_runs), merge_runs(right_runs)):
+                distance += abs(left_value - right_value)
+
+        similarity = 0
+        with util.phase("day01.similarity"):
+            right_counts = count_values(merge_runs(right_runs))
+            right = next(right_counts, None)
+            for value, count in count_values(merge_runs(left_runs)):
+                while right is not None and right[0] < value:
+                    right = next(right_counts, None)
+                if right is not None and right[0] == value:
+                    similarity += value * count * right[1]
+    return distance, similarity
+
+def spill_sorted_runs(
+    lines: Iterable[str | bytes], chunk_size: int, directory: str
+) -> tuple[list[str], list[str]]:
+    """
+    Sort the columns chunk by chunk and write each sorted chunk to its own run file.
+
+    Returns:
+        tuple: The paths of the left runs and of the right runs.
+    """
+    left_runs: list[str] = []
+    right_runs: list[str] = []
+    left: list[int] = []
+    right: list[int] = []
+    lines_iterator = iter(lines)
+    while True:
+        with util.phase("day01.parse"):
+            for line in lines_iterator:
+                row_numbers = line.split()
+                left.append(int(row_numbers[0]))
+                right.append(int(row_numbers[1]))
+                if len(left) == chunk_size:
+                    break
+        if not left:
+            break
+        with util.phase("day01.sort"):
+            for values, runs in ((left, left_runs), (right, right_runs)):
+                values.sort()
+                runs.append(os.path.join(directory, f"run{len(left_runs) + len(right_runs)}"))
+                with open(runs[-1], "wb") as run_file:
+                    array("q", values).tofile(run_file)
+                values.clear()
+    return left_runs, right_runs
+
+def reduce_runs(paths: list[str], fan_in: int) -> list[str]:
+    """
+    Merge the run files fan_in at a time into new runs until at most fan_in are left.
+
+    Each pass divides the number of runs by fan_in, so the runs are merged in
+    O(log(runs) / log(fan_in)) passes with at most fan_in of them open at once.
+    """
+    while len(paths) > fan_in:
+        merged_paths = []
+        for group_start in range(0, len(paths), fan_in):
+            group = paths[group_start:group_start + fan_in]
+            merged_paths.append(group[0] + ".merged")
+            with open(merged_paths[-1], "wb") as run_file:
+                write_run(run_file, merge_runs(group))
+            for path in group:
+                os.remove(path)
+        paths = merged_paths
+    return paths
+
+def write_run(run_file: BinaryIO, values: Iterable[int]) -> None:
+    """
+    Write a stream of values to a run file, in blocks of EXTERNAL_BUFFER_SIZE values.
+    """
+    values_iterator = iter(values)
+    while True:
+        block = array("q", islice(values_iterator, EXTERNAL_BUFFER_SIZE))
+        if not block:
+            return
+        block.tofile(run_file)
+
+def merge_runs(paths: list[str]) -> Iterator[int]:
+    """
+    Merge the sorted run files into a single sorted stream of values.
+
+    The runs share a read buffer of EXTERNAL_BUFFER_SIZE values, split evenly between them.
+    """
+    block_size = max(1, EXTERNAL_BUFFER_SIZE // max(1, len(paths)))
+    return heapq.merge(*(read_run(path, block_size) for path in paths))
+
+def read_run(path: str, block_size: int) -> Iterator[int]:
+    """
+    Stream the values of a run file, reading it in blocks of block_size values.
+    """
+    with open(path, "rb") as run_file:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(run_file, block_size)
+            except EOFError:
+                yield from block
+                return
+            yield from block
+
+def count_values(values: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """
+    Turn a sorted stream of values into a stream of (value, number of occurrences).
+    """
+    for value, group in groupby(values):
+        yield value, sum(1 for _ in group)
+
+ID_BOUND = 100_000
+
+def part_one_counting(lines: Iterable[str | bytes], id_bound: int = ID_BOUND) -> int:
+    """
+    Solve part one from histograms of location IDs below id_bound, without sorting.
+    """
+    return total_distance_counts(*count_columns(lines, id_bound))
+
+def part_two_counting(lines: Iterable[str | bytes], id_bound: int = ID_BOUND) -> int:
+    """
+    Solve part two from histograms of location IDs below id_bound.
+    """
+    return similarity_score_counts(*count_columns(lines, id_bound))
+
+def solve_counting(lines: Iterable[str | bytes], id_bound: int = ID_BOUND) -> tuple[int, int]:
+    """
+    Solve both parts from histograms of location IDs below id_bound.
+
+    This takes O(rows + id_bound) time and O(id_bound) memory whatever the number of rows.
+    """
+    left_counts, right_counts = count_columns(lines, id_bound)
+    return (
+        total_distance_counts(left_counts, right_counts),
+        similarity_score_counts(left_counts, right_counts),
+    )
+
+def count_columns(
+    lines: Iterable[str | bytes], id_bound: int
+) -> tuple[MutableSequence[int], MutableSequence[int]]:
+    """
+    Build the histograms of the left and right location IDs.
+
+    Raises:
+        ValueError: If a location ID is not within 0 <= ID < id_bound.
+    """
+    left_counts = array("Q", bytes(8 * id_bound))
+    right_counts = array("Q", bytes(8 * id_bound))
+    with util.phase("day01.parse"):
+        for line in lines:
+            row_numbers = line.split()
+            left_value, right_value = int(row_numbers[0]), int(row_numbers[1])
+            if not (0 <= left_value < id_bound and 0 <= right_value < id_bound):
+                raise ValueError(f"location ID out of range 0-{id_bound - 1}: {line!r}")
+            left_counts[left_value] += 1
+            right_counts[right_value] += 1
+    return left_counts, right_counts
+
+def total_distance_counts(left_counts: Sequence[int], right_counts: Sequence[int]) -> int:
+    """
+    Sum the distances of the sorted pairs by walking both cumulative distributions together.
+
+    The n-th smallest left ID is paired with the n-th smallest right ID, so the two
+    histograms are consumed side by side, pairing as many IDs as both current values have.
+    """
+    total = 0
+    left_value = right_value = 0
+    left_remaining, right_remaining = left_counts[0], right_counts[0]
+    bound = len(left_counts)
+    with util.phase("day01.distance"):
+        while True:
+            while not left_remaining and left_value < bound - 1:
+                left_value += 1
+                left_remaining = left_counts[left_value]
+            while not right_remaining and right_value < bound - 1:
+                right_value += 1
+                right_remaining = right_counts[right_value]
+            pairs = min(left_remaining, right_remaining)
+            if not pairs:
+                return total
+            total += pairs * abs(left_value - right_value)
+            left_remaining -= pairs
+            right_remaining -= pairs
+
+def similarity_score_counts(left_counts: Sequence[int], right_counts: Sequence[int]) -> int:
+    """
+    Compute the similarity score as the dot product of the two histograms weighted by the ID.
+    """
+    with util.phase("day01.similarity"):
+        return sum(
+            value * left * right
+            for value, (left, right) in enumerate(zip(left_counts, right_counts))
+            if left and right
+        )
+
+class LocationTracker:
+    """
+    Keeps the total distance and the similarity score of location ID pairs as they arrive.
+
+    The similarity score is updated in O(1) from histograms of the left and right IDs.
+    The distance uses that for equally long lists the sum of |left_i - right_i| over the
+    sorted pairs equals the sum over every ID x of |D(x)|, where D(x) is the number of
+    left IDs <= x minus the number of right IDs <= x. A pair (left, right) adds +1 or -1
+    to D on the IDs between them, so the distance only changes by the number of those
+    IDs where |D| grows minus those where it shrinks, see CumulativeDifferences.
+    """
+
+    def __init__(self, id_bound: int = ID_BOUND) -> None:
+        """
+        Create an empty tracker for location IDs within 0 <= ID < id_bound.
+        """
+        self.id_bound = id_bound
+        self.pairs = 0
+        self.distance = 0
+        self.similarity = 0
+        self.left_counts = array("Q", bytes(8 * id_bound))
+        self.right_counts = array("Q", bytes(8 * id_bound))
+        self._differences = CumulativeDifferences(id_bound)
+
+    def add(self, left: int, right: int) -> None:
+        """
+        Add one (left, right) pair of location IDs and update the distance and similarity.
+
+        Raises:
+            ValueError: If a location ID is not within 0 <= ID < id_bound.
+        """
+        if not (0 <= left < self.id_bound and 0 <= right < self.id_bound):
+            raise ValueError(f"location ID out of range 0-{self.id_bound - 1}: {(left, right)}")
+        self.similarity += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        if left < right:
+            self.distance += self._differences.add(left, right, 1)
+        elif right < left:
+            self.distance += self._differences.add(right, left, -1)
+        self.pairs += 1
+
+    def extend(self, pairs: Iterable[tuple[int, int]]) -> None:
+        """
+        Add a batch of (left, right) pairs.
+        """
+        for left, right in pairs:
+            self.add(left, right)
+
+class CumulativeDifferences:
+    """
+    The values D(x) for 0 <= x < size supporting range additions of +1 or -1.
+
+    D is kept in blocks of about sqrt(size) values, each with a pending offset and a
+    sorted copy of its values. Adding to a range touches the values of at most two
+    partially covered blocks and counts the values moving towards zero in the fully
+    covered ones by bisection, so it costs O(sqrt(size) log(size)).
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create the values, all of them zero.
+        """
+        self.block_size = max(1, isqrt(size))
+        block_lengths = [
+            min(self.block_size, size - start) for start in range(0, size, self.block_size)
+        ]
+        self.blocks = [[0] * length for length in block_lengths]
+        self.sorted_blocks = [[0] * length for length in block_lengths]
+        self.offsets = [0] * len(block_lengths)
+
+    def value(self, x: int) -> int:
+        """
+        Return D(x).
+        """
+        block, i = divmod(x, self.block_size)
+        return self.blocks[block][i] + self.offsets[block]
+
+    def add(self, start: int, stop: int, sign: int) -> int:
+        """
+        Add sign to D(x) for start <= x < stop and return how much the sum of |D| changed.
+        """
+        change = 0
+        for block in range(start // self.block_size, (stop - 1) // self.block_size + 1):
+            block_start = block * self.block_size
+            values = self.blocks[block]
+            first = max(start - block_start, 0)
+            last = min(stop - block_start, len(values))
+            offset = self.offsets[block]
+            if first or last < len(values):
+                # Partially covered block, update the values one by one and re-sort it
+                for i in range(first, last):
+                    value = values[i] + offset
+                    change += abs(value + sign) - abs(value)
+                    values[i] += sign
+                self.sorted_blocks[block] = sorted(values)
+                continue
+            # |D + 1| - |D| is +1 where D >= 0 and -1 where D < 0, and the other way round
+            # for -1, so the change of the whole block is its length minus twice the
+            # number of values moving towards zero
+            sorted_values = self.sorted_blocks[block]
+            if sign > 0:
+                shrinking = bisect_left(sorted_values, -offset)
+            else:
+                shrinking = len(sorted_values) - bisect_right(sorted_values, -offset)
+            change += len(sorted_values) - 2 * shrinking
+            self.offsets[block] += sign
+        return change
+
 if __name__ == "__main__":
     file_lines = util.get_lines("day01")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,12 +1,15 @@
 """Advent of Code 2024 - Day 2 tasks"""
 
+from collections.abc import Iterable
+from typing import Any
+
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str | bytes]) -> int:
     """
     --- Day 2: Red-Nosed Reports ---
     Fortunately, the first location The Historians want to search isn't a long walk from the 
@@ -52,15 +55,16 @@ def part_one(lines: list[str]) -> int:
     Analyze the unusual data from the engineers. How many reports are safe?
     """
     safe = 0
-    for line in lines:
-        levels = list(map(int, line.split(" ")))
+    with util.phase("day02.check"):
+        for line in lines:
+            levels = list(map(int, line.split()))
 
-        if check_is_safe(levels):
-            safe += 1
+            if check_is_safe(levels):
+                safe += 1
 
     return safe
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str | bytes]) -> int:
     """
     --- Part Two ---
     The engineers are surprised by the low number of safe reports until they realize they forgot 
@@ -89,31 +93,188 @@ def part_two(lines: list[str]) -> int:
     """
     safe = 0
     for line in lines:
-        levels = list(map(int, line.split(" ")))
+        levels = list(map(int, line.split()))
 
-        if check_is_safe(levels):
+        if check_is_safe(levels) or check_is_safe_with_dampener(levels):
             safe += 1
-        else:
-            # Sloppy implementation, one could optimize this a lot
-            for i, _ in enumerate(levels):
-                new_levels = levels.copy()
-                new_levels.pop(i)
-                if check_is_safe(new_levels):
-                    safe += 1
-                    break
 
     return safe
 
-def check_is_safe(levels: list[int]) -> bool:
+def solve(lines: Iterable[str | bytes]) -> tuple[int, int]:
+    """
+    Solve both parts checking each report once, using the dampener only on unsafe ones.
+    """
+    safe = 0
+    safe_with_dampener = 0
+    for line in lines:
+        levels = list(map(int, line.split()))
+
+        if check_is_safe(levels):
+            safe += 1
+            safe_with_dampener += 1
+        elif check_is_safe_with_dampener(levels):
+            safe_with_dampener += 1
+
+    return safe, safe_with_dampener
+
+def solve_parallel(file_name: str = "day02", jobs: int | None = None) -> tuple[int, int]:
+    """
+    Solve both parts by checking newline aligned byte ranges of the file in worker processes.
+
+    Each worker streams the lines of its own range from a memory map and sends back only
+    its two safe counts, so memory stays bounded per worker whatever the size of the file.
+    """
+    counts: list[tuple[int, int]] = util.map_chunks(
+        solve_chunk, util.get_input_path(file_name), jobs
+    )
+    return sum(safe for safe, _ in counts), sum(safe for _, safe in counts)
+
+def solve_chunk(file_path: str, start: int, stop: int) -> tuple[int, int]:
+    """
+    Solve both parts for the lines within a byte range of the file.
+    """
+    return solve(util.iter_chunk_lines(file_path, start, stop))
+
+def part_one_numpy(lines: Iterable[str | bytes]) -> int:
+    """
+    Solve part one by checking every report at once with the NumPy backend.
+    """
+    return int(safe_reports_numpy(*parse_reports_numpy(lines)).sum())
+
+def part_two_numpy(lines: Iterable[str | bytes]) -> int:
+    """
+    Solve part two by checking every report and removal at once with the NumPy backend.
+    """
+    values, offsets = parse_reports_numpy(lines)
+    safe = safe_reports_numpy(values, offsets)
+    return int((safe | dampened_reports_numpy(values, offsets)).sum())
+
+def solve_numpy(lines: Iterable[str | bytes]) -> tuple[int, int]:
+    """
+    Solve both parts with the NumPy backend from a single parse.
+    """
+    values, offsets = parse_reports_numpy(lines)
+    safe = safe_reports_numpy(values, offsets)
+    return int(safe.sum()), int((safe | dampened_reports_numpy(values, offsets)).sum())
+
+def parse_reports_numpy(lines: Iterable[str | bytes]) -> tuple[Any, Any]:
+    """
+    Parse the reports into one flat int64 array of levels and the offsets where each starts.
+    """
+    np = util.import_backend("numpy", "the day02 NumPy backend")
+    with util.phase("day02.parse"):
+        texts = [line.decode("ascii") if isinstance(line, bytes) else line for line in lines]
+        lengths = np.fromiter(
+            (len(text.split()) for text in texts), dtype=np.int64, count=len(texts)
+        )
+        values = np.fromstring(" ".join(texts), dtype=np.int64, sep=" ")
+    return values, np.concatenate(([0], np.cumsum(lengths)))
+
+def safe_reports_numpy(values: Any, offsets: Any) -> Any:
+    """
+    Flag the safe reports by counting the bad steps inside each report in both directions.
+    """
+    np = util.import_backend("numpy", "the day02 NumPy backend")
+    with util.phase("day02.check"):
+        lengths = np.diff(offsets)
+        report = np.repeat(np.arange(len(lengths)), lengths)
+        inside = report[1:] == report[:-1]
+        safe = np.zeros(len(lengths), dtype=bool)
+        for bad in bad_steps_numpy(np.diff(values), inside):
+            safe |= np.logical_not(np.bincount(report[1:][bad], minlength=len(lengths)))
+        return safe & (lengths > 0)
+
+def dampened_reports_numpy(values: Any, offsets: Any) -> Any:
+    """
+    Flag the reports that are safe once one level is removed, trying every level at once.
+
+    Removing a level drops the steps into and out of it and adds the step over it, so the
+    bad steps left are the report total minus those two plus the bridging one.
+    """
+    np = util.import_backend("numpy", "the day02 NumPy backend")
+    with util.phase("day02.dampener"):
+        lengths = np.diff(offsets)
+        report = np.repeat(np.arange(len(lengths)), lengths)
+        inside = report[1:] == report[:-1]
+        bridged = np.zeros(len(values), dtype=bool)
+        bridged[1:-1] = report[2:] == report[:-2]
+        bridge_steps = np.zeros(len(values), dtype=values.dtype)
+        bridge_steps[1:-1] = values[2:] - values[:-2]
+        candidates = lengths[report] > 1
+        removable = np.zeros(len(values), dtype=bool)
+        for bad, bad_bridge in zip(
+            bad_steps_numpy(np.diff(values), inside), bad_steps_numpy(bridge_steps, bridged)
+        ):
+            totals = np.bincount(report[1:][bad], minlength=len(lengths))
+            left = np.concatenate(([False], bad))
+            right = np.concatenate((bad, [False]))
+            removable |= np.logical_not(totals[report] - left - right + bad_bridge)
+        return np.bincount(report[candidates & removable], minlength=len(lengths)) > 0
+
+def bad_steps_numpy(steps: Any, inside: Any) -> tuple[Any, Any]:
+    """
+    Flag the steps within a report that are not 1 to 3 up, and those not 1 to 3 down.
+    """
+    size = abs(steps)
+    in_range = inside & (size >= 1) & (size <= 3)
+    return inside & ~(in_range & (steps > 0)), inside & ~(in_range & (steps < 0))
+
+def check_is_safe_with_dampener(levels: list[int]) -> bool:
+    """
+    Check if the levels are safe after removing one of them, in linear time.
+
+    For a given direction, a removal can only fix the report if it removes one of the two
+    levels of the first transition that breaks the rules, so only those two are tried,
+    skipping them in place instead of copying the levels.
+    """
+    if not levels:
+        return False
+    with util.phase("day02.dampener"):
+        for direction in (1, -1):
+            bad = find_bad_transition(levels, direction)
+            if (
+                bad == -1
+                or find_bad_transition(levels, direction, bad) == -1
+                or find_bad_transition(levels, direction, bad + 1) == -1
+            ):
+                return True
+    return False
+
+def find_bad_transition(levels: list[int], direction: int, skip: int = -1) -> int:
+    """
+    Find the first level whose step to the next one is not 1 to 3 in the given direction.
+
+    Args:
+        levels (list[int]): The levels to check.
+        direction (int): 1 for increasing levels, -1 for decreasing levels.
+        skip (int): Index of a level to leave out of the report.
+
+    Returns:
+        int: The index of the level starting the bad transition, or -1 if there is none.
+    """
+    previous = -1
+    for i, level in enumerate(levels):
+        if i == skip:
+            continue
+        if previous != -1 and not 1 <= (level - levels[previous]) * direction <= 3:
+            return previous
+        previous = i
+    return -1
+
+def check_is_safe(levels: list[int], max_removals: int = 0) -> bool:
     """
     Check if the levels are safe.
 
     Args:
         levels (list[int]): The levels to check.
+        max_removals (int): How many levels may be removed to make the report safe.
 
     Returns:
         bool: True if the levels are safe, False otherwise.
     """
+    if max_removals:
+        return find_levels_to_remove(levels, max_removals) is not None
+
     ok_transitions = 0
     increasing = None
     for i, level in enumerate(levels):
@@ -137,7 +298,71 @@ def check_is_safe(levels: list[int]) -> bool:
 
     return ok_transitions == len(levels) - 1
 
+def find_levels_to_remove(levels: list[int], max_removals: int) -> list[int] | None:
+    """
+    Find the fewest levels to remove to make the report safe, in O(n * k) time.
+
+    For each direction, removals[j] is the fewest levels removed before level j when j is
+    the last level kept. Only the k + 1 previous levels can come right before j, as anything
+    further back would remove more than k levels in between.
+
+    Args:
+        levels (list[int]): The levels to check.
+        max_removals (int): How many levels may be removed at most.
+
+    Returns:
+        list[int] | None: The indices of the levels to remove, or None if more are needed.
+    """
+    count = len(levels)
+    best_total = max_removals + 1
+    best: tuple[int, list[int]] | None = None
+    for direction in (1, -1):
+        removals = [max_removals + 1] * count
+        previous = [-1] * count
+        for j, level in enumerate(levels):
+            if j <= max_removals:
+                removals[j] = j
+            for i in range(max(0, j - max_removals - 1), j):
+                candidate = removals[i] + j - i - 1
+                if candidate < removals[j] and 1 <= (level - levels[i]) * direction <= 3:
+                    removals[j] = candidate
+                    previous[j] = i
+            total = removals[j] + count - 1 - j
+            if total < best_total:
+                best_total = total
+                best = (j, previous)
+
+    if best is None:
+        return None
+    last, previous = best
+    kept: set[int] = set()
+    while last != -1:
+        kept.add(last)
+        last = previous[last]
+    return [i for i in range(count) if i not in kept]
+
+def count_safe_reports(lines: Iterable[str | bytes], max_removals: int) -> list[int]:
+    """
+    Count the safe reports for every tolerance from 0 to max_removals in one pass.
+
+    Args:
+        lines (Iterable[str | bytes]): The reports to check.
+        max_removals (int): The highest number of levels that may be removed.
+
+    Returns:
+        list[int]: The number of safe reports when up to k levels may be removed, for each k.
+    """
+    counts = [0] * (max_removals + 1)
+    for line in lines:
+        to_remove = find_levels_to_remove(list(map(int, line.split())), max_removals)
+        if to_remove is not None:
+            counts[len(to_remove)] += 1
+    for k in range(1, max_removals + 1):
+        counts[k] += counts[k - 1]
+    return counts
+
 if __name__ == "__main__":
     file_lines = util.get_lines("day02")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,5 +1,9 @@
 """Advent of Code 2024 - Day 3 tasks"""
 
+from collections.abc import Iterable, Iterator
+from itertools import chain
+import mmap
+import os
 import re
 
 if not __package__:
@@ -7,8 +11,16 @@ if not __package__:
 else:
     from . import util
 
+INSTRUCTION_PATTERN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+BYTES_INSTRUCTION_PATTERN = re.compile(INSTRUCTION_PATTERN.pattern.encode("ascii"))
 
-def part_one(lines: list[str]) -> int:
+# The longest instruction is mul(123,456), so an instruction starting within a window
+# always ends within the next MAX_INSTRUCTION_LENGTH - 1 bytes after the window.
+MAX_INSTRUCTION_LENGTH = len("mul(123,456)")
+WINDOW_SIZE = 1 << 20
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 3: Mull It Over ---
     "Our computers are having issues, so I have no idea if we have any Chief Historians in
@@ -38,10 +50,10 @@ def part_one(lines: list[str]) -> int:
     Scan the corrupted memory for uncorrupted mul instructions. What do you get if you add up
     all of the results of the multiplications?
     """
-    return calculate_multiplication(lines)
+    return scan_memory(lines)[0]
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     As you scan through the corrupted memory, you notice that some of the conditional statements
@@ -68,41 +80,203 @@ def part_two(lines: list[str]) -> int:
     Handle the new instructions; what do you get if you add up all of the results of just the
     enabled multiplications?
     """
-    line = remove_dont_instructions("".join(lines))
-    return calculate_multiplication([line])
+    return scan_memory(lines)[1]
 
 
-def remove_dont_instructions(line: str) -> str:
+def solve(lines: Iterable[str]) -> tuple[int, int]:
     """
-    Remove all don't() instructions from the line.
+    Solve both parts in a single pass over the lines.
     """
-    while "don't()" in line:
-        start = line.find("don't()")
-        end = line.find("do()", start)
-        if end == -1:
-            end = len(line)
-        else:
-            end += len("do()")
-        if start < end:
-            line = line[:start] + line[end:]
+    return scan_memory(lines)
+
+
+def scan_memory(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Scan the memory once, summing the products of all mul instructions and of the enabled ones.
+
+    Returns:
+        tuple[int, int]: The sum of all the products and the sum of the enabled products.
+    """
+    with util.phase("day03.scan"):
+        total, enabled_total, _ = sum_products(
+            chain.from_iterable(map(INSTRUCTION_PATTERN.finditer, lines)), True
+        )
+    return total, enabled_total
+
+
+def sum_products(
+    matches: Iterable[re.Match[str]] | Iterable[re.Match[bytes]], enabled: bool
+) -> tuple[int, int, bool]:
+    """
+    Sum the products of the matched mul instructions, and of those enabled when they appear.
+
+    The do() and don't() instructions only toggle whether the following products are
+    enabled, so the state carries over from one match, and line, to the next.
+
+    Returns:
+        tuple[int, int, bool]: The sum of all the products, the sum of the enabled products
+        and whether mul instructions are enabled after the last match.
+    """
+    total = 0
+    enabled_total = 0
+    for match in matches:
+        kind = match.lastindex
+        if kind == 2:
+            product = int(match[1]) * int(match[2])
+            total += product
+            if enabled:
+                enabled_total += product
         else:
-            break
-    return line
+            enabled = kind == 3
+    return total, enabled_total, enabled
+
+
+def solve_mapped(file_name: str = "day03", window_size: int = WINDOW_SIZE) -> tuple[int, int]:
+    """
+    Solve both parts by scanning the memory-mapped input file in fixed-size windows.
+
+    Only one window and its small overlap are copied out of the map at a time, so huge
+    memory dumps are scanned without reading them, or their lines, into memory.
+    """
+    total, enabled_total, _ = scan_file_range(
+        util.get_input_path(file_name), 0, -1, True, window_size
+    )
+    return total, enabled_total
+
+
+def scan_file_range(
+    file_path: str, start: int, stop: int, enabled: bool, window_size: int = WINDOW_SIZE
+) -> tuple[int, int, bool]:
+    """
+    Scan the instructions starting within a byte range of the file, one window at a time.
 
+    Args:
+        file_path (str): The path of the memory dump.
+        start (int): The offset of the range.
+        stop (int): The offset where the range ends, or -1 for the end of the file.
+        enabled (bool): Whether mul instructions are enabled at the start of the range.
+        window_size (int): How many bytes are scanned per window.
 
-def calculate_multiplication(lines: list[str]) -> int:
+    Returns:
+        tuple[int, int, bool]: The sum of all the products, the sum of the enabled products
+        and whether mul instructions are enabled at the end of the range.
     """
-    Calculate the multiplication of the two numbers in the mul instruction.
+    with util.phase("day03.scan"):
+        return sum_products(iter_window_matches(file_path, start, stop, window_size), enabled)
+
+
+ChunkSummary = tuple[int, int, int, bool | None]
+
+
+def solve_parallel(
+    file_name: str = "day03", jobs: int | None = None, window_size: int = WINDOW_SIZE
+) -> tuple[int, int]:
+    """
+    Solve both parts by scanning byte ranges of the file in worker processes.
+
+    The ranges are split at plain byte offsets, as memory dumps are often a single line.
+    A range owns the instructions starting in it, which it reads past its end if needed,
+    and no instruction contains the start of another one, so none is lost or doubled.
+    The workers cannot know whether their range starts enabled, so each one returns its
+    enabled sum for both cases and its final state. A sequential pass over the summaries
+    then picks the sum matching the state left by the ranges before.
+    """
+    summaries: list[ChunkSummary] = util.map_chunks(
+        summarize_file_range,
+        util.get_input_path(file_name),
+        jobs,
+        (window_size,),
+        split_lines=False,
+    )
+    total = 0
+    enabled_total = 0
+    enabled = True
+    for chunk_total, if_enabled, if_disabled, final_state in summaries:
+        total += chunk_total
+        enabled_total += if_enabled if enabled else if_disabled
+        if final_state is not None:
+            enabled = final_state
+    return total, enabled_total
+
+
+def summarize_file_range(
+    file_path: str, start: int, stop: int, window_size: int = WINDOW_SIZE
+) -> ChunkSummary:
+    """
+    Scan a byte range of the file without knowing whether it starts enabled.
+
+    The products before the first do() or don't() only count if the range starts enabled,
+    while the state from the first toggle on does not depend on how the range started.
+
+    Returns:
+        ChunkSummary: The sum of all the products, the enabled sum if the range starts
+        enabled, the enabled sum if it starts disabled, and the state at the end of the
+        range, or None if the range does not toggle it.
+    """
+    total = 0
+    before_toggle = 0
+    with util.phase("day03.scan"):
+        matches = iter_window_matches(file_path, start, stop, window_size)
+        for match in matches:
+            if match.lastindex == 2:
+                product = int(match[1]) * int(match[2])
+                total += product
+                before_toggle += product
+            else:
+                rest_total, after_toggle, final_state = sum_products(
+                    matches, match.lastindex == 3
+                )
+                return total + rest_total, before_toggle + after_toggle, after_toggle, final_state
+    return total, before_toggle, 0, None
+
+
+def iter_window_matches(
+    file_path: str, start: int, stop: int, window_size: int
+) -> Iterator[re.Match[bytes]]:
+    """
+    Memory-map the file and yield the instructions starting within a byte range, in order.
+
+    Each window is copied out of the map with an overlap of MAX_INSTRUCTION_LENGTH - 1
+    bytes so that an instruction straddling its end is still matched whole. Matches
+    starting in the overlap are left to the next window, which resumes the search after
+    the end of the last match.
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            stop = size if stop == -1 else stop
+            resume = start
+            for window_start in range(start, stop, window_size):
+                window_stop = min(window_start + window_size, stop)
+                window = mapped[window_start:min(window_stop + MAX_INSTRUCTION_LENGTH - 1, size)]
+                for match in BYTES_INSTRUCTION_PATTERN.finditer(
+                    window, max(resume - window_start, 0)
+                ):
+                    if window_start + match.start() >= window_stop:
+                        break
+                    resume = window_start + match.end()
+                    yield match
+                release_pages(mapped, window_start, window_stop)
+
+
+def release_pages(mapped: mmap.mmap, start: int, stop: int) -> None:
+    """
+    Drop the mapped pages of a scanned byte range from memory, where the platform allows it.
+
+    The pages of a read-only file mapping are reloaded from the file if touched again, so
+    releasing the scanned ones keeps the resident memory to about one window.
     """
-    result = 0
-    for line in lines:
-        matches = re.findall(r"mul\((\d{1,3}),(\d{1,3})\)", line)
-        for x, y in matches:
-            result += int(x) * int(y)
-    return result
+    if hasattr(mmap, "MADV_DONTNEED"):
+        start -= start % mmap.PAGESIZE
+        stop -= stop % mmap.PAGESIZE
+        if start < stop:
+            mapped.madvise(mmap.MADV_DONTNEED, start, stop - start)
 
 
 if __name__ == "__main__":
     file_lines = util.get_lines("day03")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
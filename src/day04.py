@@ -1,12 +1,17 @@
 """Advent of Code 2024 - Day 4 tasks"""
 
+from collections import deque
+from collections.abc import Iterable
+import os
+from typing import cast
+
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 4: Ceres Search ---
     "Looks like the Chief's not here. Next!" One of The Historians pulls out a device and pushes
@@ -56,38 +61,10 @@ def part_one(lines: list[str]) -> int:
     Take a look at the little Elf's word search. How many times does XMAS appear?
 
     """
+    return count_xmas(util.Grid(lines))
 
-    x = len(lines[0])
-    y = len(lines)
-    count = 0
-
-    # horizontal check
-    for i in range(y):
-        count += lines[i].count("XMAS")
-        count += lines[i].count("SAMX")
-
-    # vertical check
-    for i in range(x):
-        row = "".join([line[i] for line in lines])
-        count += row.count("XMAS")
-        count += row.count("SAMX")
-
-    # diagonal check (top left to bottom right)
-    for yy in range(y - 3):
-        for xx in range(x - 3):
-            count += "".join([lines[yy + j][xx + j] for j in range(4)]).count("XMAS")
-            count += "".join([lines[yy + j][xx + j] for j in range(4)]).count("SAMX")
-
-    # diagonal check (top right to bottom left)
-    for yy in range(3, y):
-        for xx in range(x - 3):
-            count += "".join([lines[yy - j][xx + j] for j in range(4)]).count("XMAS")
-            count += "".join([lines[yy - j][xx + j] for j in range(4)]).count("SAMX")
-
-    return count
 
-
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     The Elf looks quizzically at you. Did you misunderstand the assignment?
@@ -118,27 +95,499 @@ def part_two(lines: list[str]) -> int:
     Flip the word search from the instructions back over to the word search side and try again.
     How many times does an X-MAS appear?
     """
+    return count_x_mas(util.Grid(lines))
+
+
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts from a single grid.
+    """
+    grid = util.Grid(lines)
+    return count_xmas(grid), count_x_mas(grid)
+
+
+def count_xmas(grid: util.Grid) -> int:
+    """
+    Count the occurrences of XMAS in all the 8 directions.
+    """
     count = 0
-    for i in range(1, len(lines) - 1):
-        for j in range(1, len(lines[i]) - 1):
-            x_mas_pattern_found = 0
-            if lines[i][j] != "A":
+
+    # horizontal check
+    with util.phase("day04.horizontal"):
+        for row in grid.lines(0, 1):
+            count += row.count(b"XMAS")
+            count += row.count(b"SAMX")
+
+    # vertical check
+    with util.phase("day04.vertical"):
+        for column in grid.lines(1, 0):
+            count += column.count(b"XMAS")
+            count += column.count(b"SAMX")
+
+    with util.phase("day04.diagonal"):
+        # diagonal check (top left to bottom right)
+        for diagonal in grid.lines(1, 1):
+            count += diagonal.count(b"XMAS")
+            count += diagonal.count(b"SAMX")
+
+        # diagonal check (top right to bottom left)
+        for diagonal in grid.lines(1, -1):
+            count += diagonal.count(b"XMAS")
+            count += diagonal.count(b"SAMX")
+
+    return count
+
+
+def count_x_mas(grid: util.Grid) -> int:
+    """
+    Count the MAS crosses centred on an A.
+    """
+    cells, width = grid.cells, grid.width
+    m_and_s = {ord("M"), ord("S")}
+    count = 0
+    with util.phase("day04.x_mas"):
+        for row, col in grid.find("A"):
+            if not (0 < row < grid.height - 1 and 0 < col < width - 1):
+                continue
+            index = grid.index(row, col)
+            # Both diagonals through the A must read MAS in either direction
+            if {cells[index - width - 1], cells[index + width + 1]} != m_and_s:
                 continue
-            if lines[i - 1][j - 1] == "M" and lines[i + 1][j + 1] == "S":
-                x_mas_pattern_found += 1
-            if lines[i - 1][j + 1] == "M" and lines[i + 1][j - 1] == "S":
-                x_mas_pattern_found += 1
-            if lines[i - 1][j - 1] == "S" and lines[i + 1][j + 1] == "M":
-                x_mas_pattern_found += 1
-            if lines[i - 1][j + 1] == "S" and lines[i + 1][j - 1] == "M":
-                x_mas_pattern_found += 1
-
-            if x_mas_pattern_found == 2:
+            if {cells[index - width + 1], cells[index + width - 1]} == m_and_s:
                 count += 1
     return count
 
 
+def part_one_numpy(lines: Iterable[str], word: str = "XMAS") -> int:
+    """
+    Solve part one, or count any other word, with the vectorized NumPy backend.
+    """
+    return count_word_numpy(util.Grid(lines), word)
+
+
+def count_word_numpy(grid: util.Grid, word: str) -> int:
+    """
+    Count the occurrences of a word in all the 8 directions with shifted-slice masks.
+
+    For each direction, the anchor cells are those where the whole word fits in the grid.
+    The slice of the grid holding the k-th letter of every anchor is the anchor slice
+    shifted k steps in the direction, so one equality mask per letter, combined with a
+    logical and, marks the anchors where the word starts.
+    """
+    np = util.import_backend("numpy", "the day04 NumPy backend")
+    letters = word.encode("ascii")
+    if not letters:
+        return 0
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+    span = len(letters) - 1
+    count = 0
+    with util.phase("day04.numpy"):
+        for d_row, d_col in util.ALL_DIRECTIONS:
+            rows = anchor_range(grid.height, d_row, span)
+            cols = anchor_range(grid.width, d_col, span)
+            if not rows or not cols:
+                continue
+            found = np.ones((len(rows), len(cols)), dtype=bool)
+            for k, letter in enumerate(letters):
+                found &= cells[
+                    rows.start + k * d_row:rows.stop + k * d_row,
+                    cols.start + k * d_col:cols.stop + k * d_col,
+                ] == letter
+            count += int(found.sum())
+    return count
+
+
+def anchor_range(size: int, step: int, span: int) -> range:
+    """
+    Return the positions along one axis from which span more steps stay within the grid.
+    """
+    return range(max(0, -step * span), size - max(0, step * span))
+
+
+def count_words(grid: util.Grid, words: Iterable[str]) -> dict[str, int]:
+    """
+    Count the occurrences of many words in all the 8 directions in a single pass over the grid.
+
+    Reading a line backwards finds the reversed words, so every row, column and diagonal
+    is fed once through one automaton for the words and their reverses.
+    """
+    patterns = {word: word.encode("ascii") for word in words}
+    automaton = WordAutomaton([*patterns.values(), *(word[::-1] for word in patterns.values())])
+    with util.phase("day04.automaton"):
+        for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for line in grid.lines(d_row, d_col):
+                automaton.feed(line)
+    found = automaton.counts()
+    return {
+        word: found[pattern] + found[pattern[::-1]] if pattern else 0
+        for word, pattern in patterns.items()
+    }
+
+
+class WordAutomaton:
+    """
+    An Aho-Corasick automaton counting the occurrences of several words in texts.
+
+    The trie of the words is completed into a table of 256 transitions per state, following
+    the failure links, so that feeding a text costs one table lookup per byte. Each text
+    only counts the visits of every state; a word occurs once per visit of a state whose
+    chain of failure links passes through the end of the word, which counts() sums up in
+    reverse breadth-first order.
+    """
+
+    def __init__(self, words: Iterable[bytes]) -> None:
+        """
+        Build the automaton for the words.
+        """
+        children: list[dict[int, int]] = [{}]
+        self.ends: dict[bytes, int] = {}
+        for word in words:
+            state = 0
+            for byte in word:
+                if byte not in children[state]:
+                    children[state][byte] = len(children)
+                    children.append({})
+                state = children[state][byte]
+            self.ends[word] = state
+
+        self.transitions = [[0] * 256 for _ in children]
+        self.failures = [0] * len(children)
+        self.order: list[int] = []
+        queue = deque(children[0].values())
+        for byte, child in children[0].items():
+            self.transitions[0][byte] = child
+        while queue:
+            state = queue.popleft()
+            self.order.append(state)
+            failure_row = self.transitions[self.failures[state]]
+            row = self.transitions[state]
+            row[:] = failure_row
+            for byte, child in children[state].items():
+                self.failures[child] = failure_row[byte]
+                row[byte] = child
+                queue.append(child)
+        self.visits = [0] * len(children)
+
+    def feed(self, text: bytes) -> None:
+        """
+        Run a text through the automaton, from the start state.
+        """
+        transitions, visits = self.transitions, self.visits
+        state = 0
+        for byte in text:
+            state = transitions[state][byte]
+            visits[state] += 1
+
+    def counts(self) -> dict[bytes, int]:
+        """
+        Return how many times each word occurred in the texts fed so far.
+        """
+        totals = self.visits[:]
+        for state in reversed(self.order):
+            totals[self.failures[state]] += totals[state]
+        return {word: totals[state] for word, state in self.ends.items()}
+
+
+TEMPLATE_WILDCARD = "."
+
+X_MAS_TEMPLATE = ["M.S", ".A.", "M.S"]
+
+
+def part_two_numpy(lines: Iterable[str]) -> int:
+    """
+    Solve part two with the vectorized NumPy template matcher.
+    """
+    return count_template_numpy(util.Grid(lines), X_MAS_TEMPLATE)
+
+
+def count_template_numpy(grid: util.Grid, template: list[str], transform: bool = True) -> int:
+    """
+    Count the placements of a rectangular template, with TEMPLATE_WILDCARD matching any cell.
+
+    Like count_word_numpy, every letter of the template ands an equality mask of the grid
+    shifted by the letter's offset into the mask of the top left corners of the matches.
+
+    Args:
+        grid (Grid): The grid to search.
+        template (list[str]): The rows of the template.
+        transform (bool): Also count the distinct rotations and reflections of the template.
+
+    Returns:
+        int: The number of placements of the template, or of any of its variants.
+    """
+    np = util.import_backend("numpy", "the day04 NumPy backend")
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+    variants = template_variants(template) if transform else [tuple(template)]
+    count = 0
+    with util.phase("day04.template"):
+        for variant in variants:
+            rows = range(grid.height - len(variant) + 1)
+            cols = range(grid.width - len(variant[0]) + 1)
+            if not rows or not cols:
+                continue
+            found = np.ones((len(rows), len(cols)), dtype=bool)
+            for d_row, line in enumerate(variant):
+                for d_col, letter in enumerate(line):
+                    if letter != TEMPLATE_WILDCARD:
+                        found &= cells[
+                            d_row:d_row + len(rows), d_col:d_col + len(cols)
+                        ] == ord(letter)
+            count += int(found.sum())
+    return count
+
+
+def template_variants(template: list[str]) -> list[tuple[str, ...]]:
+    """
+    Return the distinct rotations and reflections of a template.
+
+    Raises:
+        ValueError: If the template is empty or its rows differ in length.
+    """
+    if not template or not template[0] or any(len(row) != len(template[0]) for row in template):
+        raise ValueError("a template must be a non-empty rectangle")
+    variants = set()
+    rows = tuple(template)
+    for _ in range(4):
+        rows = tuple("".join(col) for col in zip(*rows[::-1]))
+        variants.add(rows)
+        variants.add(tuple(row[::-1] for row in rows))
+    return sorted(variants)
+
+
+def part_one_bitboard(lines: Iterable[str]) -> int:
+    """
+    Solve part one with the big-int bitboard engine.
+    """
+    return count_word_bitboard(util.Grid(lines), "XMAS")
+
+
+def part_two_bitboard(lines: Iterable[str]) -> int:
+    """
+    Solve part two with the big-int bitboard engine.
+    """
+    return count_x_mas_bitboard(util.Grid(lines))
+
+
+def solve_bitboard(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts with the big-int bitboard engine from a single grid.
+    """
+    grid = util.Grid(lines)
+    return count_word_bitboard(grid, "XMAS"), count_x_mas_bitboard(grid)
+
+
+def letter_masks(grid: util.Grid, letters: Iterable[str]) -> dict[str, int]:
+    """
+    Encode the cells of each letter as the set bits of one int.
+
+    The cell at (row, col) is bit row * (width + 1) + col. The extra guard bit at the end of
+    every row is never set, so that a line of cells stepping off the side of the grid hits
+    it instead of wrapping around to the next row.
+    """
+    guarded = b"\0".join(grid.row(row).tobytes() for row in range(grid.height))
+    masks = {}
+    for letter in letters:
+        table = bytearray(b"0" * 256)
+        table[ord(letter)] = ord("1")
+        masks[letter] = int(guarded.translate(table)[::-1] or b"0", 2)
+    return masks
+
+
+def shift(mask: int, offset: int) -> int:
+    """
+    Shift the mask so that its bit i is the bit i + offset of the original.
+    """
+    return mask >> offset if offset >= 0 else mask << -offset
+
+
+def count_word_bitboard(grid: util.Grid, word: str, anchor_rows: range | None = None) -> int:
+    """
+    Count the occurrences of a word in all the 8 directions with one and of shifted masks each.
+
+    For a direction whose step moves offset bits, the word starts at the bits still set
+    after anding together the mask of each k-th letter shifted by k * offset. If anchor_rows
+    is given, only the occurrences starting on those rows are counted.
+    """
+    if not word:
+        return 0
+    masks = letter_masks(grid, set(word))
+    stride = grid.width + 1
+    anchors = rows_mask(grid, anchor_rows)
+    count = 0
+    with util.phase("day04.bitboard"):
+        for d_row, d_col in util.ALL_DIRECTIONS:
+            offset = d_row * stride + d_col
+            found = masks[word[0]] & anchors
+            for k, letter in enumerate(word[1:], 1):
+                found &= shift(masks[letter], k * offset)
+            count += found.bit_count()
+    return count
+
+
+def count_x_mas_bitboard(grid: util.Grid, anchor_rows: range | None = None) -> int:
+    """
+    Count the MAS crosses centred on an A with shifted masks of the corner letters.
+
+    If anchor_rows is given, only the crosses centred on those rows are counted.
+    """
+    masks = letter_masks(grid, "MAS")
+    m_mask, s_mask = masks["M"], masks["S"]
+    stride = grid.width + 1
+    found = masks["A"] & rows_mask(grid, anchor_rows)
+    with util.phase("day04.bitboard"):
+        # Both diagonals through the A must have an M at one end and an S at the other
+        for offset in (stride + 1, stride - 1):
+            found &= (shift(m_mask, -offset) & shift(s_mask, offset)) | (
+                shift(s_mask, -offset) & shift(m_mask, offset)
+            )
+    return found.bit_count()
+
+
+def rows_mask(grid: util.Grid, rows: range | None) -> int:
+    """
+    Return the bitboard mask of all the cells on the rows, or of every cell if rows is None.
+    """
+    if rows is None:
+        return -1
+    stride: int = grid.width + 1
+    return ((1 << (len(rows) * stride)) - 1) << (rows.start * stride)
+
+
+STRIPE_HALO = 3
+
+
+def solve_parallel(lines: Iterable[str], jobs: int | None = None) -> tuple[int, int]:
+    """
+    Solve both parts by searching horizontal stripes of the grid in worker processes.
+
+    The grid is copied once into shared memory, which the workers attach to by name. Each
+    worker loads its stripe with STRIPE_HALO rows above and below, enough for any XMAS
+    starting in the stripe, and counts only the matches anchored on the stripe's own
+    rows: the X of an XMAS and the A of an X-MAS. Every match is so counted exactly once.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    grid = util.Grid(lines)
+    jobs = jobs or os.cpu_count() or 1
+    stripe_height = max(1, -(-grid.height // (jobs * util.CHUNKS_PER_JOB)))
+    memory = SharedMemory(create=True, size=max(1, len(grid.cells)))
+    try:
+        cast(memoryview, memory.buf)[:len(grid.cells)] = grid.cells
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    solve_stripe,
+                    memory.name,
+                    grid.width,
+                    range(start, min(start + stripe_height, grid.height)),
+                    grid.height,
+                )
+                for start in range(0, grid.height, stripe_height)
+            ]
+            counts: list[tuple[int, int]] = [future.result() for future in futures]
+    finally:
+        memory.close()
+        memory.unlink()
+    return sum(xmas for xmas, _ in counts), sum(x_mas for _, x_mas in counts)
+
+
+def solve_stripe(memory_name: str, width: int, rows: range, height: int) -> tuple[int, int]:
+    """
+    Solve both parts for the matches anchored on a stripe of rows of a grid in shared memory.
+    """
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing.shared_memory import SharedMemory
+
+    top = max(0, rows.start - STRIPE_HALO)
+    bottom = min(height, rows.stop + STRIPE_HALO)
+    memory = SharedMemory(name=memory_name)
+    try:
+        cells = cast(memoryview, memory.buf)
+        grid = util.Grid(bytes(cells[row * width:(row + 1) * width]) for row in range(top, bottom))
+    finally:
+        memory.close()
+    anchor_rows = range(rows.start - top, rows.stop - top)
+    return count_word_bitboard(grid, "XMAS", anchor_rows), count_x_mas_bitboard(grid, anchor_rows)
+
+
+class WordSearchIndex:
+    """
+    Keeps the XMAS and X-MAS counts of a grid up to date as its cells are edited.
+
+    An edit can only create or break the matches through the edited cell: the XMAS
+    windows in the 8 directions holding the cell at any of the 4 positions, and the
+    X-MAS crosses centred on the cell or one of its 8 neighbours. Those are counted
+    before and after the edit, so each edit costs O(1) whatever the size of the grid.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        """
+        Build the grid and count all its matches once.
+        """
+        self.grid = util.Grid(lines)
+        self.xmas_count = count_xmas(self.grid)
+        self.x_mas_count = count_x_mas(self.grid)
+
+    def set_cell(self, row: int, col: int, char: str) -> None:
+        """
+        Set the cell at (row, col) to the character and update the counts.
+
+        Raises:
+            ValueError: If the cell is outside the grid.
+        """
+        if not self.grid.in_bounds(row, col):
+            raise ValueError(f"cell outside the grid: {(row, col)}")
+        xmas_before, x_mas_before = self._count_through(row, col)
+        self.grid[row, col] = char
+        xmas_after, x_mas_after = self._count_through(row, col)
+        self.xmas_count += xmas_after - xmas_before
+        self.x_mas_count += x_mas_after - x_mas_before
+
+    def set_cells(self, cells: Iterable[tuple[int, int, str]]) -> None:
+        """
+        Apply a batch of (row, col, char) edits.
+        """
+        for row, col, char in cells:
+            self.set_cell(row, col, char)
+
+    def _count_through(self, row: int, col: int) -> tuple[int, int]:
+        grid = self.grid
+        xmas = 0
+        for d_row, d_col in util.ALL_DIRECTIONS:
+            for k in range(4):
+                start_row, start_col = row - k * d_row, col - k * d_col
+                if (
+                    grid.in_bounds(start_row, start_col)
+                    and grid.in_bounds(start_row + 3 * d_row, start_col + 3 * d_col)
+                    and all(
+                        grid[start_row + i * d_row, start_col + i * d_col] == letter
+                        for i, letter in enumerate("XMAS")
+                    )
+                ):
+                    xmas += 1
+
+        x_mas = 0
+        for centre_row, centre_col in grid.neighbours(row, col, util.ALL_DIRECTIONS):
+            x_mas += is_x_mas(grid, centre_row, centre_col)
+        return xmas, x_mas + is_x_mas(grid, row, col)
+
+
+def is_x_mas(grid: util.Grid, row: int, col: int) -> bool:
+    """
+    Check if the cell is the A at the centre of two crossing MAS.
+    """
+    if not (0 < row < grid.height - 1 and 0 < col < grid.width - 1) or grid[row, col] != "A":
+        return False
+    m_and_s = {"M", "S"}
+    return {grid[row - 1, col - 1], grid[row + 1, col + 1]} == m_and_s and {
+        grid[row - 1, col + 1], grid[row + 1, col - 1]
+    } == m_and_s
+
+
 if __name__ == "__main__":
     file_lines = util.get_lines("day04")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,14 +1,19 @@
 """Advent of Code 2024 - Day 5 tasks"""
 
 from collections import defaultdict
+from collections.abc import Iterable
 
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
+PARSER_VERSION = 1
 
-def part_one(lines: list[str]) -> int:
+RulesAndUpdates = tuple[dict[str, dict[str, bool]], list[list[str]], dict[str, dict[str, bool]]]
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 5: Print Queue ---
     Satisfied with their search on Ceres, the squadron of scholars suggests subsequently scanning
@@ -112,17 +117,18 @@ def part_one(lines: list[str]) -> int:
     Determine which updates are already in the correct order. What do you get if you add up the
     middle page number from those correctly-ordered updates?
     """
+    return part_one_parsed(get_rules_and_updates(lines))
 
-    correct_updates, _ = get_correct_and_incorrect_updates(lines)
-
-    result = 0
-    for update in correct_updates:
-        result += get_middle_page_number(update)
 
-    return result
+def part_one_parsed(rules_and_updates: RulesAndUpdates) -> int:
+    """
+    Solve part one from the output of get_rules_and_updates.
+    """
+    correct_updates, _ = get_correct_and_incorrect_updates(rules_and_updates)
+    return sum_correct_updates(correct_updates)
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     While the Elves get to work printing the correctly-ordered updates, you have a
@@ -141,18 +147,62 @@ def part_two(lines: list[str]) -> int:
     page numbers after correctly ordering just those updates?
 
     """
-    _, incorrect_updates = get_correct_and_incorrect_updates(lines)
+    return part_two_parsed(get_rules_and_updates(lines))
+
 
+def part_two_parsed(rules_and_updates: RulesAndUpdates) -> int:
+    """
+    Solve part two from the output of get_rules_and_updates.
+    """
+    _, incorrect_updates = get_correct_and_incorrect_updates(rules_and_updates)
+    return sum_sorted_incorrect_updates(incorrect_updates, rules_and_updates[2])
+
+
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts from a single parse and categorization of the updates.
+    """
+    return solve_parsed(get_rules_and_updates(lines))
+
+
+def solve_parsed(rules_and_updates: RulesAndUpdates) -> tuple[int, int]:
+    """
+    Solve both parts from the output of get_rules_and_updates.
+    """
+    correct_updates, incorrect_updates = get_correct_and_incorrect_updates(rules_and_updates)
+    return (
+        sum_correct_updates(correct_updates),
+        sum_sorted_incorrect_updates(incorrect_updates, rules_and_updates[2]),
+    )
+
+
+def sum_correct_updates(correct_updates: list[list[str]]) -> int:
+    """
+    Add up the middle page numbers of the correctly-ordered updates.
+    """
+    result = 0
+    for update in correct_updates:
+        result += get_middle_page_number(update)
+
+    return result
+
+
+def sum_sorted_incorrect_updates(
+    incorrect_updates: list[list[str]], values: dict[str, dict[str, bool]]
+) -> int:
+    """
+    Add up the middle page numbers of the incorrectly-ordered updates once sorted.
+    """
     result = 0
     for incorrect_update in incorrect_updates:
-        result += get_middle_page_number(incorrect_update)
+        with util.phase("day05.sort"):
+            sorted_update = sort_update(incorrect_update, values)
+        result += get_middle_page_number(sorted_update)
 
     return result
 
 
-def get_rules_and_updates(
-    lines: list[str],
-) -> tuple[dict[str, dict[str, bool]], list[list[str]], dict[str, dict[str, bool]]]:
+def get_rules_and_updates(lines: Iterable[str]) -> RulesAndUpdates:
     """
     Parses a list of strings to extract rules and updates.
     """
@@ -160,25 +210,27 @@ def get_rules_and_updates(
     values: dict[str, dict[str, bool]] = defaultdict(dict)
     updates = []
 
-    for line in lines:
-        if "|" in line:
-            key, value = line.split("|")
-            rules[key][value] = True
-            values[value][key] = True
-        elif line.strip():
-            updates.append(line.strip().split(","))
+    with util.phase("day05.parse"):
+        for line in lines:
+            if "|" in line:
+                key, value = line.split("|")
+                rules[key][value] = True
+                values[value][key] = True
+            elif line.strip():
+                updates.append(line.strip().split(","))
 
     return rules, updates, values
 
 
 def get_correct_and_incorrect_updates(
-    lines: list[str],
+    rules_and_updates: RulesAndUpdates,
 ) -> tuple[list[list[str]], list[list[str]]]:
     """
-    Categorizes updates into correct and incorrect based on given rules.
+    Categorizes updates into correct and incorrect based on given rules, leaving the
+    incorrect ones unsorted.
     """
 
-    rules, updates, values = get_rules_and_updates(lines)
+    rules, updates, _ = rules_and_updates
 
     correct_updates = []
     incorrect_updates = []
@@ -195,7 +247,7 @@ def get_correct_and_incorrect_updates(
         if correct:
             correct_updates.append(update)
         else:
-            incorrect_updates.append(sort_update(update, values))
+            incorrect_updates.append(update)
     return correct_updates, incorrect_updates
 
 
@@ -220,7 +272,15 @@ def sort_update(update: list[str], values: dict[str, dict[str, bool]]) -> list[s
     return update_sorted
 
 
+def load_parsed(file_name: str = "day05") -> RulesAndUpdates:
+    """
+    Load the rules and updates of the input file through the parse cache.
+    """
+    parsed: RulesAndUpdates = util.get_parsed(file_name, get_rules_and_updates, PARSER_VERSION)
+    return parsed
+
+
 if __name__ == "__main__":
-    file_lines = util.get_lines("day05")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve_parsed(load_parsed())
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,6 +1,6 @@
 """Advent of Code 2024 - Day 6 tasks"""
 
-from collections import defaultdict
+from collections.abc import Iterable
 
 
 if not __package__:
@@ -9,10 +9,12 @@ else:
     from . import util
 
 
-next_coord_map = {"up": (0, -1), "right": (1, 0), "down": (0, 1), "left": (-1, 0)}
+PARSER_VERSION = 2
+
+next_coord_map = {"up": (-1, 0), "right": (0, 1), "down": (1, 0), "left": (0, -1)}
 next_direction_map = {"up": "right", "right": "down", "down": "left", "left": "up"}
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str]) -> int:
     """
         --- Day 6: Guard Gallivant ---
     The Historians use their fancy device again, this time to whisk you all away to the North Pole
@@ -74,24 +76,20 @@ def part_one(lines: list[str]) -> int:
     Predict the path of the guard. How many distinct positions will the guard visit before leaving
     the mapped area?
     """
-    coords, position = lines_to_coords(lines)
-    direction = "up"
+    return part_one_parsed(lines_to_grid(lines))
 
-    while (0 <= position[0] < len(lines[0])) and (0 <= position[1] < len(lines)):
-        coords[position[0]][position[1]] = "X"
-        position, direction = get_next_position_and_direction(
-            position, direction, coords
-        )
-
-    visited_positions = 0
-    for row in coords.values():
-        for char in row.values():
-            if char == "X":
-                visited_positions += 1
+
+def part_one_parsed(grid_and_start: tuple[util.Grid, tuple[int, int]]) -> int:
+    """
+    Solve part one from the output of lines_to_grid.
+    """
+    grid = grid_and_start[0].copy()
+    mark_path(grid, grid_and_start[1])
+    visited_positions: int = grid.cells.count(b"X")
     return visited_positions
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     While The Historians begin working around the guard's patrol route, you borrow their fancy
@@ -133,80 +131,100 @@ def part_two(lines: list[str]) -> int:
     You need to get the guard stuck in a loop by adding a single new obstruction. How many different
     positions could you choose for this obstruction?
     """
-    coords, initial_position = lines_to_coords(lines)
+    return part_two_parsed(lines_to_grid(lines))
+
+
+def part_two_parsed(grid_and_start: tuple[util.Grid, tuple[int, int]]) -> int:
+    """
+    Solve part two from the output of lines_to_grid.
+    """
+    grid = grid_and_start[0].copy()
+    mark_path(grid, grid_and_start[1])
+    return count_loop_obstacles(grid, grid_and_start[1])
+
+
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts from a single parse, walking the guard path once.
+    """
+    return solve_parsed(lines_to_grid(lines))
+
+
+def solve_parsed(grid_and_start: tuple[util.Grid, tuple[int, int]]) -> tuple[int, int]:
+    """
+    Solve both parts from the output of lines_to_grid.
+    """
+    grid = grid_and_start[0].copy()
+    mark_path(grid, grid_and_start[1])
+    visited_positions: int = grid.cells.count(b"X")
+    return visited_positions, count_loop_obstacles(grid, grid_and_start[1])
+
 
-    # Run the simulation to find the path of the guard
+def mark_path(grid: util.Grid, initial_position: tuple[int, int]) -> None:
+    """
+    Run the simulation to find the path of the guard, marking it with X on the grid.
+    """
     position = initial_position
     direction = "up"
-    while (0 <= position[0] < len(lines[0])) and (0 <= position[1] < len(lines)):
-        coords[position[0]][
-            position[1]
-        ] = "X"  # mark the path with X so no need to check all coords in next phase
-        position, direction = get_next_position_and_direction(
-            position, direction, coords
-        )
+    with util.phase("day06.path"):
+        while grid.in_bounds(*position):
+            grid[position] = "X"
+            position, direction = get_next_position_and_direction(
+                position, direction, grid
+            )
+
 
+def count_loop_obstacles(grid: util.Grid, initial_position: tuple[int, int]) -> int:
+    """
+    Count the positions on the marked path where a new obstruction makes the guard loop.
+    """
     blocked = 0
-    for col in coords.values():
-        for y, char in col.items():
-            # Try to block only the positions where the guard has been initially
-            if char != "X":
-                continue
+    with util.phase("day06.obstacles"):
+        # Try to block only the positions where the guard has been initially
+        for obstacle in list(grid.find("X")):
             steps = set()
             direction = "up"
             position = initial_position
-            col[y] = "#"
-            while (0 <= position[0] < len(lines[0])) and (
-                0 <= position[1] < len(lines)
-            ):
+            grid[obstacle] = "#"
+            while grid.in_bounds(*position):
                 if (position, direction) in steps:
                     blocked += 1
                     break
                 steps.add((position, direction))
                 position, direction = get_next_position_and_direction(
-                    position, direction, coords
+                    position, direction, grid
                 )
             # restore back to original state
-            col[y] = "X"
+            grid[obstacle] = "X"
     return blocked
 
 
-def lines_to_coords(
-    lines: list[str],
-) -> tuple[dict[int, dict[int, str]], tuple[int, int]]:
+def lines_to_grid(lines: Iterable[str]) -> tuple[util.Grid, tuple[int, int]]:
     """
-    Converts a list of strings into a dictionary of coordinates and identifies
-    the starting position.
+    Converts the lines into a grid and identifies the (row, col) starting position.
     """
-    start = (-1, -1)
-    coords: dict[int, dict[int, str]] = defaultdict(dict)
-    for y, line in enumerate(lines):
-        for x, char in enumerate(line):
-            coords[x][y] = char
-            if char == "^":
-                start = (x, y)
-    return coords, start
+    with util.phase("day06.parse"):
+        grid = util.Grid(lines)
+        start = next(grid.find("^"), (-1, -1))
+    return grid, start
 
 
 def get_next_position_and_direction(
-    position: tuple[int, int], direction: str, coords: dict[int, dict[int, str]]
+    position: tuple[int, int], direction: str, grid: util.Grid
 ) -> tuple[tuple[int, int], str]:
     """
-    Calculate the next position and direction based on the current position,
-    direction, and coordinates.
+    Calculate the next (row, col) position and direction based on the current position,
+    direction, and grid.
     """
     next_position = (
         position[0] + next_coord_map[direction][0],
         position[1] + next_coord_map[direction][1],
     )
 
-    if (
-        next_position[0] not in coords
-        or next_position[1] not in coords[next_position[0]]
-    ):
+    if not grid.in_bounds(*next_position):
         return next_position, direction
 
-    if coords[next_position[0]][next_position[1]] == "#":
+    if grid[next_position] == "#":
         direction = next_direction_map[direction]
     else:
         position = next_position
@@ -214,7 +232,17 @@ def get_next_position_and_direction(
     return position, direction
 
 
+def load_parsed(file_name: str = "day06") -> tuple[util.Grid, tuple[int, int]]:
+    """
+    Load the grid and the guard's start of the input file through the parse cache.
+    """
+    parsed: tuple[util.Grid, tuple[int, int]] = util.get_parsed(
+        file_name, lines_to_grid, PARSER_VERSION
+    )
+    return parsed
+
+
 if __name__ == "__main__":
-    file_lines = util.get_lines("day06")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve_parsed(load_parsed())
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,5 +1,6 @@
 """Advent of Code 2024 - Day 7 tasks"""
 
+from collections.abc import Iterable
 from itertools import product
 import re
 
@@ -8,8 +9,12 @@ if not __package__:
 else:
     from . import util
 
+PARSER_VERSION = 1
 
-def part_one(lines: list[str]) -> int:
+Equation = tuple[int, list[int]]
+
+
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 7: Bridge Repair ---
     The Historians take you to a familiar rope bridge over a river in the middle of a jungle. The
@@ -59,12 +64,17 @@ def part_one(lines: list[str]) -> int:
     Determine which equations could possibly be true. What is their total calibration result?
 
 
+    """
+    return part_one_parsed(map(parse_equation, lines))
+
+
+def part_one_parsed(equations: Iterable[Equation]) -> int:
+    """
+    Solve part one from the equations returned by parse_equation.
     """
     operators = ["+", "*"]
     total = 0
-    for line in lines:
-        row_value = int(line.split(":")[0])
-        numbers = re.findall(r"\d+", line.split(":")[1])
+    for row_value, numbers in equations:
         expressions = form_expressions(numbers, operators)
         if has_valid_expression(expressions, row_value):
             total += int(row_value)
@@ -72,7 +82,7 @@ def part_one(lines: list[str]) -> int:
     return total
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     The engineers seem concerned; the total calibration result you gave them is nowhere close to
@@ -96,12 +106,17 @@ def part_two(lines: list[str]) -> int:
     Using your new knowledge of elephant hiding spots, determine which equations could possibly
     be true. What is their total calibration result?
     """
+    return part_two_parsed(map(parse_equation, lines))
+
+
+def part_two_parsed(equations: Iterable[Equation]) -> int:
+    """
+    Solve part two from the equations returned by parse_equation.
+    """
     operators = ["+", "*"]
     operators2 = ["+", "*", "||"]
     total = 0
-    for line in lines:
-        row_value = int(line.split(":")[0])
-        numbers = re.findall(r"\d+", line.split(":")[1])
+    for row_value, numbers in equations:
         expressions = form_expressions(numbers, operators)
         if has_valid_expression(expressions, row_value):
             total += int(row_value)
@@ -113,14 +128,59 @@ def part_two(lines: list[str]) -> int:
     return total
 
 
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts evaluating the + and * expressions of each equation only once.
+    """
+    return solve_parsed(map(parse_equation, lines))
+
+
+def solve_parsed(equations: Iterable[Equation]) -> tuple[int, int]:
+    """
+    Solve both parts from the equations returned by parse_equation.
+    """
+    operators = ["+", "*"]
+    operators2 = ["+", "*", "||"]
+    total = 0
+    total2 = 0
+    for row_value, numbers in equations:
+        expressions = form_expressions(numbers, operators)
+        if has_valid_expression(expressions, row_value):
+            total += row_value
+            total2 += row_value
+        else:
+            expressions = form_expressions(numbers, operators2)
+            if has_valid_expression(expressions, row_value):
+                total2 += row_value
+
+    return total, total2
+
+
+def parse_equation(line: str) -> Equation:
+    """
+    Parses a line into the test value and the list of numbers of the equation.
+    """
+    with util.phase("day07.parse"):
+        test_value, numbers = line.split(":")
+        return int(test_value), list(map(int, re.findall(r"\d+", numbers)))
+
+
+def parse_equations(lines: list[str]) -> list[Equation]:
+    """
+    Parses all the lines into equations.
+    """
+    return list(map(parse_equation, lines))
+
+
 def form_expressions(numbers: list[int], operators: list[str]) -> list[str]:
     """
     Forms all possible expressions from the given numbers and operators.
     """
     expressions = []
-    for ops in product(operators, repeat=len(numbers) - 1):
-        expression = "".join(f"{n}{o}" for n, o in zip(numbers, ops + ("",)))
-        expressions.append(expression)
+    with util.phase("day07.form_expressions"):
+        for ops in product(operators, repeat=len(numbers) - 1):
+            expression = "".join(f"{n}{o}" for n, o in zip(numbers, ops + ("",)))
+            expressions.append(expression)
     return expressions
 
 
@@ -128,10 +188,11 @@ def has_valid_expression(expressions: list[str], target: int) -> bool:
     """
     Checks if any of the given expressions evaluate to the target value.
     """
-    for expression in expressions:
-        evaluated_value = evaluate_expression(expression)
-        if evaluated_value == target:
-            return True
+    with util.phase("day07.has_valid_expression"):
+        for expression in expressions:
+            evaluated_value = evaluate_expression(expression)
+            if evaluated_value == target:
+                return True
     return False
 
 
@@ -158,7 +219,15 @@ def evaluate_expression(expression: str) -> int:
     return result
 
 
+def load_parsed(file_name: str = "day07") -> list[Equation]:
+    """
+    Load the equations of the input file through the parse cache.
+    """
+    parsed: list[Equation] = util.get_parsed(file_name, parse_equations, PARSER_VERSION)
+    return parsed
+
+
 if __name__ == "__main__":
-    file_lines = util.get_lines("day07")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve_parsed(load_parsed())
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
@@ -1,12 +1,14 @@
 """Advent of Code 2024 - Day 8 tasks"""
 
+from collections.abc import Iterable
+
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 8: Resonant Collinearity ---
     You find yourselves on the roof of a top-secret Easter Bunny installation.
@@ -99,16 +101,16 @@ def part_one(lines: list[str]) -> int:
     Calculate the impact of the signal. How many unique locations within the bounds of the map
     contain an antinode?
     """
+    grid = util.Grid(lines, fill=b".")
     antinodes = set()
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == ".":
-                continue
-            antinodes.update(check_possibilities(lines, row, col, char))
+    with util.phase("day08.antinodes"):
+        for char in get_frequencies(grid):
+            for row, col in grid.find(char):
+                antinodes.update(check_possibilities(grid, row, col, char))
     return len(antinodes)
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     Watching over your shoulder as you work, one of The Historians asks if you took the effects
@@ -153,61 +155,70 @@ def part_two(lines: list[str]) -> int:
     Calculate the impact of the signal using this updated model. How many unique locations within
     the bounds of the map contain an antinode?
     """
+    grid = util.Grid(lines, fill=b".")
     antinodes = set()
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char == ".":
-                continue
-            antinodes.update(check_possibilities(lines, row, col, char, True))
+    with util.phase("day08.antinodes"):
+        for char in get_frequencies(grid):
+            for row, col in grid.find(char):
+                antinodes.update(check_possibilities(grid, row, col, char, True))
     return len(antinodes)
 
 
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts from a single grid and a single pass over the antennas.
+    """
+    grid = util.Grid(lines, fill=b".")
+    antinodes = set()
+    antinodes2 = set()
+    with util.phase("day08.antinodes"):
+        for char in get_frequencies(grid):
+            for row, col in grid.find(char):
+                antinodes.update(check_possibilities(grid, row, col, char))
+                antinodes2.update(check_possibilities(grid, row, col, char, True))
+    return len(antinodes), len(antinodes2)
+
+
+def get_frequencies(grid: util.Grid) -> list[str]:
+    """
+    Return the distinct antenna frequencies found in the grid.
+    """
+    return sorted(chr(value) for value in set(grid.cells) - {ord(".")})
+
+
 def check_possibilities(
-    lines: list[str], row: int, col: int, char: str, part2: bool = False
+    grid: util.Grid, row: int, col: int, char: str, part2: bool = False
 ) -> set[tuple[int, int]]:
     """
     Check possible positions in a grid based on a given character.
 
-    This function iterates through a list of strings (representing lines in a grid)
-    and checks for possible positions (antinodes) relative to a specified row and column
-    where the given character appears. It uses the differences in row and column indices
-    to determine potential positions and validates them based on certain conditions.
+    This function goes through the other antennas of the grid with the same character
+    and checks for possible positions (antinodes) relative to a specified row and column.
+    It uses the differences in row and column indices to determine potential positions
+    and validates them based on certain conditions.
     """
     antinodes = set()
-    for row2, line2 in enumerate(lines):
-        for col2, char2 in enumerate(line2):
-            if char != char2:
-                continue
-            row_diff = row2 - row
-            col_diff = col2 - col
-            if not row_diff and not col_diff:
-                continue
-
-            if part2:
-                options = get_options2(
-                    row_diff, col_diff, row, col, (len(lines), len(lines[0]))
-                )
-                for option in options:
-                    if option[0] < 0 or option[1] < 0:
-                        pass  # continue
-                    if in_range(lines, option[0], option[1]):
-                        antinodes.add((option[0], option[1]))
-            else:
-                options = get_options(row_diff, col_diff)
-                for option in options:
-                    if in_range(lines, row + option[0], col + option[1]):
-                        antinodes.add((row + option[0], col + option[1]))
+    for row2, col2 in grid.find(char):
+        row_diff = row2 - row
+        col_diff = col2 - col
+        if not row_diff and not col_diff:
+            continue
+
+        if part2:
+            options = get_options2(
+                row_diff, col_diff, row, col, (grid.height, grid.width)
+            )
+            for option in options:
+                if grid.in_bounds(option[0], option[1]):
+                    antinodes.add((option[0], option[1]))
+        else:
+            options = get_options(row_diff, col_diff)
+            for option in options:
+                if grid.in_bounds(row + option[0], col + option[1]):
+                    antinodes.add((row + option[0], col + option[1]))
     return antinodes
 
 
-def in_range(lines: list[str], row: int, col: int) -> bool:
-    """
-    Check if the given row and column indices are within the bounds
-    of the 2D grid represented by lines.
-    """
-    return 0 <= row < len(lines) and 0 <= col < len(lines[0])
-
-
 def get_options(row_diff: int, col_diff: int) -> list[tuple[int, int]]:
     """
     Generate a list of option tuples based on the differences in row and column values.
@@ -271,5 +282,6 @@ def get_options2(
 
 if __name__ == "__main__":
     file_lines = util.get_lines("day08")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
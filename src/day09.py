@@ -1,12 +1,14 @@
 """Advent of Code 2024 - Day 9 tasks"""
 
+from collections.abc import Iterable
+
 if not __package__:
     import util  # type: ignore
 else:
     from . import util
 
 
-def part_one(lines: list[str]) -> int:
+def part_one(lines: Iterable[str]) -> int:
     """
     --- Day 9: Disk Fragmenter ---
     Another push of the button leaves you in the familiar hallways of some friendly amphipods!
@@ -74,17 +76,18 @@ def part_one(lines: list[str]) -> int:
     Compact the amphipod's hard drive using the process he requested. What is the resulting
     filesystem checksum?
     """
-    input_data = lines[0]
+    input_data = next(iter(lines))
     current_number = 0
     disk_map = ""
-    for i, char in enumerate(input_data):
-        if not i % 2:
-            file_length = int(char)
-            disk_map += str(chr(current_number + 47)) * file_length
-        else:
-            free_space_length = int(char)
-            disk_map += "." * free_space_length
-            current_number += 1
+    with util.phase("day09.layout"):
+        for i, char in enumerate(input_data):
+            if not i % 2:
+                file_length = int(char)
+                disk_map += str(chr(current_number + 47)) * file_length
+            else:
+                free_space_length = int(char)
+                disk_map += "." * free_space_length
+                current_number += 1
 
     # Swap positions of the last digit and the first dot
     disk_map_list = list(disk_map)
@@ -92,35 +95,46 @@ def part_one(lines: list[str]) -> int:
     last_non_dot_index = disk_map_len - 1
     first_dot_index = 0
 
-    while last_non_dot_index > first_dot_index:
-        while last_non_dot_index > 0 and disk_map_list[last_non_dot_index] == ".":
-            last_non_dot_index -= 1
-        while first_dot_index < disk_map_len and disk_map_list[first_dot_index] != ".":
-            first_dot_index += 1
-
-        if last_non_dot_index > first_dot_index:
-            disk_map_list[last_non_dot_index], disk_map_list[first_dot_index] = (
-                disk_map_list[first_dot_index],
-                disk_map_list[last_non_dot_index],
-            )
+    with util.phase("day09.compact"):
+        while last_non_dot_index > first_dot_index:
+            while last_non_dot_index > 0 and disk_map_list[last_non_dot_index] == ".":
+                last_non_dot_index -= 1
+            while first_dot_index < disk_map_len and disk_map_list[first_dot_index] != ".":
+                first_dot_index += 1
+
+            if last_non_dot_index > first_dot_index:
+                disk_map_list[last_non_dot_index], disk_map_list[first_dot_index] = (
+                    disk_map_list[first_dot_index],
+                    disk_map_list[last_non_dot_index],
+                )
     disk_map = "".join(disk_map_list)
 
     # Calculate the checksum
 
-    checksum = sum(
-        i * (ord(char) - 47) for i, char in enumerate(disk_map) if char != "."
-    )
+    with util.phase("day09.checksum"):
+        checksum = sum(
+            i * (ord(char) - 47) for i, char in enumerate(disk_map) if char != "."
+        )
     return checksum
 
 
-def part_two(lines: list[str]) -> int:
+def part_two(lines: Iterable[str]) -> int:
     """
     --- Part Two ---
     """
-    return len(lines)
+    return sum(1 for _ in lines)
+
+
+def solve(lines: Iterable[str]) -> tuple[int, int]:
+    """
+    Solve both parts from the same lines.
+    """
+    disk = list(lines)
+    return part_one(disk), part_two(disk)
 
 
 if __name__ == "__main__":
     file_lines = util.get_lines("day09")
-    print("Part one: " + str(part_one(file_lines)))
-    print("Part two: " + str(part_two(file_lines)))
+    part_one_result, part_two_result = solve(file_lines)
+    print("Part one: " + str(part_one_result))
+    print("Part two: " + str(part_two_result))
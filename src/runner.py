@@ -0,0 +1,159 @@
+"""Advent of Code 2024 - Runner executing the day tasks in a process pool"""
+
+import argparse
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import glob
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+from . import util
+
+STARTUP_BUDGET_MS = 50.0
+
+
+def get_available_days() -> list[int]:
+    """
+    Return the numbers of the days that have a solution module.
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = glob.glob(src_dir + "/day[0-9][0-9].py")
+    return sorted(int(os.path.basename(path)[3:5]) for path in paths)
+
+
+def parse_numbers(value: str) -> list[int]:
+    """
+    Parse a comma separated list of numbers and inclusive ranges, e.g. "1-3,5".
+    """
+    numbers: list[int] = []
+    for item in value.split(","):
+        try:
+            if "-" in item:
+                first, last = map(int, item.split("-"))
+                if first > last:
+                    raise argparse.ArgumentTypeError(f"reversed range: {item!r}")
+                numbers.extend(range(first, last + 1))
+            else:
+                numbers.append(int(item))
+        except ValueError as error:
+            raise argparse.ArgumentTypeError(f"invalid number or range: {item!r}") from error
+    if not numbers:
+        raise argparse.ArgumentTypeError(f"no numbers given: {value!r}")
+    return sorted(set(numbers))
+
+
+def run_task(day: int, part: int) -> tuple[int, int, int, float]:
+    """
+    Solve one part of one day and measure its wall time, reading the input in the worker.
+
+    Days defining PARSER_VERSION read their input with load_parsed, which goes through
+    the parse cache, so that repeated runs and both parts share one parse.
+
+    Returns:
+        tuple: The day, the part, the answer and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(f"{__package__}.day{day:02}")
+    answer: int
+    if hasattr(module, "PARSER_VERSION"):
+        # Days with a parser version load their parsed input through the parse cache
+        solver = module.part_one_parsed if part == 1 else module.part_two_parsed
+        answer = solver(module.load_parsed())
+    else:
+        solver = module.part_one if part == 1 else module.part_two
+        answer = solver(util.get_lines(f"day{day:02}"))
+    return day, part, answer, time.perf_counter() - start
+
+
+def measure_import_times(module_name: str) -> list[tuple[str, int, int, int]]:
+    """
+    Import the module in a fresh interpreter with -X importtime and collect its imports.
+
+    Returns:
+        list: The (module, nesting depth, self microseconds, cumulative microseconds) of
+        every import made by the module, the module itself last.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True, check=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(self_time), int(cumulative_time)))
+
+    # Keep only the subtree of the module, the imports done by the interpreter startup are
+    # listed before it on depth 0
+    end = next(i for i, item in enumerate(imports) if item[0] == module_name)
+    start = end
+    while start > 0 and imports[start - 1][1] > imports[end][1]:
+        start -= 1
+    return imports[start:end + 1]
+
+
+def startup_report(days: list[int], budget_ms: float, top: int = 5) -> bool:
+    """
+    Print the import time of each day module and its most expensive imports.
+
+    Returns:
+        bool: True if every day module imports within the budget.
+    """
+    within_budget = True
+    for day in days:
+        imports = measure_import_times(f"{__package__}.day{day:02}")
+        total_ms = imports[-1][3] / 1000
+        within_budget = within_budget and total_ms <= budget_ms
+        status = "ok" if total_ms <= budget_ms else "OVER BUDGET"
+        print(f"Day {day:02}: {total_ms:.1f} ms ({status}, budget {budget_ms:.0f} ms)")
+        for name, _, self_time, cumulative_time in sorted(imports, key=lambda item: -item[2])[:top]:
+            print(f"    {name}: {self_time / 1000:.1f} ms self, "
+                  f"{cumulative_time / 1000:.1f} ms cumulative")
+    return within_budget
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Run the selected days and parts in parallel, printing the results as they finish.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src", description=__doc__)
+    parser.add_argument("--days", type=parse_numbers, default=get_available_days(),
+                        help="days to run, e.g. 1-9 or 1,3,5 (default: all)")
+    parser.add_argument("--parts", type=parse_numbers, default=[1, 2],
+                        help="parts to run, e.g. 1,2 (default: both)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print the import time breakdown of the days instead of running them")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS,
+                        help=f"import time budget in ms per day (default: {STARTUP_BUDGET_MS:.0f})")
+    args = parser.parse_args(argv)
+
+    missing_days = set(args.days) - set(get_available_days())
+    if missing_days:
+        parser.error(f"no solution for days: {sorted(missing_days)}")
+    if not set(args.parts) <= {1, 2}:
+        parser.error("parts must be 1 or 2")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("jobs must be at least 1")
+
+    if args.startup_report:
+        if not startup_report(args.days, args.startup_budget):
+            parser.exit(1, "Import time budget exceeded\n")
+        return
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(run_task, day, part) for day in args.days for part in args.parts
+        ]
+        for future in as_completed(futures):
+            day, part, answer, elapsed = future.result()
+            print(f"Day {day:02} part {part}: {answer} ({elapsed:.3f} s)", flush=True)
+    print(f"Total wall time: {time.perf_counter() - start:.3f} s")
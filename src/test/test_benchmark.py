@@ -0,0 +1,80 @@
+"""Advent of Code 2024 - Unit tests for the benchmark harness"""
+
+import pytest
+
+from ..benchmark.generators import GENERATORS, day06, day07
+from ..benchmark.harness import benchmark, estimate_base, estimate_exponent, main
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generators(day: int) -> None:
+    """
+    Test function for the input generators.
+
+    This function tests that the generators are deterministic and that the days solve their output
+
+    Returns:
+        None
+    """
+    assert GENERATORS[day](10, 1) == GENERATORS[day](10, 1)
+    assert GENERATORS[day](10, 1) != GENERATORS[day](10, 2)
+    assert len(benchmark(day, 1, [4, 8])) == 2
+
+
+def test_estimate_exponent() -> None:
+    """
+    Test function for estimate_exponent.
+
+    This function tests the fitted exponent of exactly quadratic samples
+
+    Returns:
+        None
+    """
+    assert estimate_exponent([(10, 1.0), (20, 4.0), (40, 16.0)]) == pytest.approx(2)
+    assert estimate_exponent([(10, 1.0)]) is None
+    assert estimate_base([(4, 1.0), (6, 9.0), (8, 81.0)]) == pytest.approx(3)
+
+
+def test_day07_operands() -> None:
+    """
+    Test function for the day 7 generator.
+
+    This function tests that the size sets the number of operands of each equation
+
+    Returns:
+        None
+    """
+    lines = day07(5, 0, equations=3)
+    assert len(lines) == 3
+    assert all(len(line.split(": ")[1].split()) == 5 for line in lines)
+
+
+def test_day06_height() -> None:
+    """
+    Test function for the day 6 generator.
+
+    This function tests that the map can be made wider than it is high
+
+    Returns:
+        None
+    """
+    lines = day06(12, 0, height=5)
+    assert len(lines) == 5
+    assert all(len(line) == 12 for line in lines)
+    assert lines[2][6] == "^"
+    assert day06(7) == day06(7, height=7)
+
+
+def test_sizes_skip_exponential_days(capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test function for the --sizes option.
+
+    This function tests that day 7 keeps its own operand counts when sizes are given
+
+    Returns:
+        None
+    """
+    main(["--days", "1,7", "--parts", "1", "--sizes", "100,200", "--budget", "0"])
+    output = capsys.readouterr().out
+    assert "Day 01 part 1" in output and "[100: " in output
+    assert "Day 07 part 1" in output and "[4: " in output
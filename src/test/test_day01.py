@@ -1,6 +1,22 @@
 """Advent of Code 2024 - Unit tests for day 1 tasks"""
-from src.util import get_lines
-from ..day01 import part_one, part_two
+import pytest
+
+from src.util import get_lines, iter_lines
+from ..day01 import (
+    LocationTracker,
+    part_one,
+    part_one_counting,
+    part_one_external,
+    part_one_numpy,
+    part_two,
+    part_two_counting,
+    part_two_external,
+    part_two_numpy,
+    solve,
+    solve_counting,
+    solve_external,
+    solve_numpy,
+)
 
 
 example_data = """3   4
@@ -21,6 +37,8 @@ def test_part_one() -> None:
     """
     assert part_one(example_data) == 11
     assert part_one(get_lines("day01")) == 1889772
+    assert part_one(iter_lines("day01")) == 1889772
+    assert part_one(iter_lines("day01", as_bytes=True)) == 1889772
 
 
 def test_part_two() -> None:
@@ -34,3 +52,93 @@ def test_part_two() -> None:
     """
     assert part_two(example_data) == 31
     assert part_two(get_lines("day01")) == 23228917
+    assert part_two(iter_lines("day01")) == 23228917
+    assert part_two(iter_lines("day01", as_bytes=True)) == 23228917
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (11, 31)
+    assert solve(get_lines("day01")) == (1889772, 23228917)
+
+
+def test_numpy_backend() -> None:
+    """
+    Test function for the NumPy backend.
+
+    This function tests that the NumPy backend gives the same results as the default one
+
+    Returns:
+        None
+    """
+    pytest.importorskip("numpy")
+    assert part_one_numpy(example_data) == 11
+    assert part_two_numpy(example_data) == 31
+    assert solve_numpy(iter_lines("day01", as_bytes=True)) == (1889772, 23228917)
+    assert not part_two_numpy(["1   2"])
+
+
+def test_external_sort() -> None:
+    """
+    Test function for the external merge sort mode.
+
+    This function tests that spilling small chunks to disk gives the same results
+
+    Returns:
+        None
+    """
+    assert part_one_external(example_data, chunk_size=2) == 11
+    assert part_two_external(example_data, chunk_size=4) == 31
+    assert solve_external(iter_lines("day01"), chunk_size=64) == (1889772, 23228917)
+    assert solve_external(iter_lines("day01"), chunk_size=2, fan_in=3) == (1889772, 23228917)
+
+
+def test_counting() -> None:
+    """
+    Test function for the counting engine.
+
+    This function tests the histogram based engine against the default one
+
+    Returns:
+        None
+    """
+    assert part_one_counting(example_data, id_bound=10) == 11
+    assert part_two_counting(example_data, id_bound=10) == 31
+    assert solve_counting(iter_lines("day01", as_bytes=True)) == (1889772, 23228917)
+    with pytest.raises(ValueError):
+        solve_counting(example_data, id_bound=5)
+
+
+def test_location_tracker() -> None:
+    """
+    Test function for LocationTracker.
+
+    This function tests that the tracked scores match solve after every batch of pairs
+
+    Returns:
+        None
+    """
+    tracker = LocationTracker(id_bound=10)
+    rows = []
+    for line in example_data:
+        left, right = map(int, line.split())
+        tracker.add(left, right)
+        rows.append(line)
+        assert (tracker.distance, tracker.similarity) == solve(rows)
+    assert tracker.pairs == len(example_data)
+
+    tracker = LocationTracker()
+    lines = get_lines("day01")
+    for start in range(0, len(lines), 250):
+        batch = lines[start:start + 250]
+        tracker.extend((int(line.split()[0]), int(line.split()[1])) for line in batch)
+        assert (tracker.distance, tracker.similarity) == solve(lines[:start + 250])
+    with pytest.raises(ValueError):
+        tracker.add(-1, 0)
@@ -1,6 +1,23 @@
 """Advent of Code 2024 - Unit tests for day 2 tasks"""
-from src.util import get_lines
-from ..day02 import part_one, part_two
+import itertools
+import random
+
+import pytest
+
+from src.util import get_lines, iter_lines
+from ..day02 import (
+    check_is_safe,
+    check_is_safe_with_dampener,
+    count_safe_reports,
+    find_levels_to_remove,
+    part_one,
+    part_one_numpy,
+    part_two,
+    part_two_numpy,
+    solve,
+    solve_numpy,
+    solve_parallel,
+)
 
 
 example_data = """7 6 4 2 1
@@ -21,6 +38,8 @@ def test_part_one() -> None:
     """
     assert part_one(example_data) == 2
     assert part_one(get_lines("day02")) == 670
+    assert part_one(iter_lines("day02")) == 670
+    assert part_one(iter_lines("day02", as_bytes=True)) == 670
 
 
 def test_part_two() -> None:
@@ -34,3 +53,118 @@ def test_part_two() -> None:
     """
     assert part_two(example_data) == 4
     assert part_two(get_lines("day02")) == 700
+    assert part_two(iter_lines("day02")) == 700
+    assert part_two(iter_lines("day02", as_bytes=True)) == 700
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (2, 4)
+    assert solve(get_lines("day02")) == (670, 700)
+
+
+def test_solve_parallel() -> None:
+    """
+    Test function for solve_parallel.
+
+    This function tests that checking chunks of the file in worker processes gives the same results
+
+    Returns:
+        None
+    """
+    assert solve_parallel("day02", jobs=2) == (670, 700)
+    assert solve_parallel("day02", jobs=1) == (670, 700)
+
+
+def test_numpy_backend() -> None:
+    """
+    Test function for the NumPy backend.
+
+    This function tests that the batched NumPy checks give the same results as the default ones
+
+    Returns:
+        None
+    """
+    pytest.importorskip("numpy")
+    assert part_one_numpy(example_data) == 2
+    assert part_two_numpy(example_data) == 4
+    assert solve_numpy(iter_lines("day02", as_bytes=True)) == (670, 700)
+    assert part_two_numpy(["5"]) == 1
+
+    rng = random.Random(15)
+    lines = [
+        " ".join(str(rng.randrange(8)) for _ in range(rng.randrange(8))) for _ in range(5000)
+    ]
+    assert solve_numpy(lines) == solve(lines)
+
+
+def test_check_is_safe_with_dampener() -> None:
+    """
+    Test function for check_is_safe_with_dampener.
+
+    This function tests the linear dampener against removing every level in turn
+
+    Returns:
+        None
+    """
+
+    def brute_force(levels: list[int]) -> bool:
+        return check_is_safe(levels) or any(
+            check_is_safe(levels[:i] + levels[i + 1:]) for i in range(len(levels))
+        )
+
+    rng = random.Random(2)
+    reports = [list(map(int, line.split())) for line in example_data + get_lines("day02")]
+    reports += [[rng.randrange(8) for _ in range(rng.randrange(8))] for _ in range(5000)]
+    for levels in reports:
+        assert (
+            check_is_safe(levels) or check_is_safe_with_dampener(levels)
+        ) == brute_force(levels), levels
+
+    lines = ["7 6 4 2 1", ""]
+    assert solve(lines) == (1, 1)
+    assert count_safe_reports(lines, 1) == [1, 1]
+
+
+def test_find_levels_to_remove() -> None:
+    """
+    Test function for find_levels_to_remove.
+
+    This function tests the removal search against trying every set of up to three removals
+
+    Returns:
+        None
+    """
+
+    def fewest_removals(levels: list[int], max_removals: int) -> int | None:
+        for k in range(max_removals + 1):
+            for removed in itertools.combinations(range(len(levels)), k):
+                kept = [level for i, level in enumerate(levels) if i not in removed]
+                if check_is_safe(kept):
+                    return k
+        return None
+
+    rng = random.Random(14)
+    for _ in range(2000):
+        levels = [rng.randrange(8) for _ in range(rng.randrange(9))]
+        max_removals = rng.randrange(4)
+        to_remove = find_levels_to_remove(levels, max_removals)
+        expected = fewest_removals(levels, max_removals)
+        if expected is None:
+            assert to_remove is None, levels
+        else:
+            assert to_remove is not None and len(to_remove) == expected, levels
+            assert check_is_safe([level for i, level in enumerate(levels) if i not in to_remove])
+        assert check_is_safe(levels, max_removals) == (expected is not None), levels
+
+    assert find_levels_to_remove([1, 3, 2, 4, 5], 1) in ([1], [2])
+    assert find_levels_to_remove([1, 2, 7, 8, 9], 1) is None
+    assert count_safe_reports(example_data, 2) == [2, 4, 6]
+    assert count_safe_reports(get_lines("day02"), 1) == [670, 700]
@@ -1,7 +1,22 @@
 """Advent of Code 2024 - Unit tests for day 3 tasks"""
 
-from src.util import get_lines
-from ..day03 import part_one, part_two
+from pathlib import Path
+
+import pytest
+
+from src import util
+from src.benchmark.generators import day03
+from src.util import chunk_ranges, get_lines, iter_lines
+from ..day03 import (
+    part_one,
+    part_two,
+    scan_file_range,
+    scan_memory,
+    solve,
+    solve_mapped,
+    solve_parallel,
+    summarize_file_range,
+)
 
 
 def test_part_one() -> None:
@@ -18,6 +33,7 @@ def test_part_one() -> None:
     ]
     assert part_one(example_data) == 161
     assert part_one(get_lines("day03")) == 161289189
+    assert part_one(iter_lines("day03")) == 161289189
 
 
 def test_part_two() -> None:
@@ -34,3 +50,94 @@ def test_part_two() -> None:
     ]
     assert part_two(example_data) == 48
     assert part_two(get_lines("day03")) == 83595109
+    assert part_two(iter_lines("day03")) == 83595109
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    example_data = [
+        "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+    ]
+    assert solve(example_data) == (161, 48)
+    assert solve(get_lines("day03")) == (161289189, 83595109)
+
+
+def test_scan_memory() -> None:
+    """
+    Test function for scan_memory.
+
+    This function tests that the enabled state carries over from one line to the next
+
+    Returns:
+        None
+    """
+    memory = ["mul(1,2)don't()", "mul(3,4)do()mul(5,6)", "don't()do()don't()"]
+    assert scan_memory(memory) == (44, 32)
+    assert scan_memory(["don't()don't()mul(2,2)do()do()mul(3,3)mul(1000,1)"]) == (13, 9)
+    assert scan_memory([]) == (0, 0)
+
+
+def test_solve_mapped(tmp_path: Path) -> None:
+    """
+    Test function for solve_mapped.
+
+    This function tests that instructions straddling the window boundaries are matched whole
+
+    Returns:
+        None
+    """
+    expected = solve(get_lines("day03"))
+    for window_size in (1, 5, 11, 12, 13, 4096):
+        assert solve_mapped("day03", window_size) == expected
+
+    memory = tmp_path / "memory.txt"
+    memory.write_bytes(b"mul(1,2)don't()mul(3,4)\ndo()mul(5,6)")
+    for window_size in range(1, 40):
+        assert scan_file_range(str(memory), 0, -1, True, window_size) == (44, 32, True)
+    assert scan_file_range(str(memory), 0, 8, False, 3) == (2, 0, False)
+    assert scan_file_range(str(memory), 8, 24, True, 3) == (12, 0, False)
+    memory.write_bytes(b"")
+    assert scan_file_range(str(memory), 0, -1, True) == (0, 0, True)
+
+
+def test_solve_parallel(tmp_path: Path) -> None:
+    """
+    Test function for solve_parallel.
+
+    This function tests that the chunk summaries are stitched back with the right states
+
+    Returns:
+        None
+    """
+    assert solve_parallel("day03", jobs=2) == (161289189, 83595109)
+    assert solve_parallel("day03", jobs=1, window_size=7) == (161289189, 83595109)
+
+    memory = tmp_path / "memory.txt"
+    memory.write_bytes(b"mul(1,2)don't()mul(3,4)do()mul(5,6)")
+    assert summarize_file_range(str(memory), 0, 8) == (2, 2, 0, None)
+    assert summarize_file_range(str(memory), 8, 27) == (12, 0, 0, True)
+    assert summarize_file_range(str(memory), 27, 36) == (30, 30, 0, None)
+    assert summarize_file_range(str(memory), 0, 36) == (44, 32, 30, True)
+
+
+def test_solve_parallel_single_line(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for solve_parallel on a memory dump without newlines.
+
+    This function tests that a single line dump is still split between the workers
+
+    Returns:
+        None
+    """
+    memory = tmp_path / "dump.txt"
+    memory.write_text(day03(5000)[0], encoding="ascii")
+    monkeypatch.setattr(util, "get_input_path", lambda file_name: str(memory))
+    assert len(chunk_ranges(str(memory), 16, split_lines=False)) == 16
+    assert solve_parallel("dump", jobs=4) == scan_memory(day03(5000))
@@ -1,7 +1,26 @@
 """Advent of Code 2024 - Unit tests for day 4 tasks"""
 
-from src.util import get_lines
-from ..day04 import part_one, part_two
+import random
+
+import pytest
+
+from src.util import ALL_DIRECTIONS, Grid, get_lines
+from ..day04 import (
+    X_MAS_TEMPLATE,
+    WordSearchIndex,
+    count_template_numpy,
+    count_word_bitboard,
+    count_word_numpy,
+    count_words,
+    part_one,
+    part_one_numpy,
+    part_two,
+    part_two_numpy,
+    solve,
+    solve_bitboard,
+    solve_parallel,
+    template_variants,
+)
 
 
 example_data = """MMMSXXMASM
@@ -18,6 +37,38 @@ MXMXAXMASX""".split(
 )
 
 
+def walk(grid: Grid, word: str) -> int:
+    """
+    Count the occurrences of a word by walking every direction from every cell.
+    """
+    return sum(
+        all(
+            grid.in_bounds(row + k * d_row, col + k * d_col)
+            and grid[row + k * d_row, col + k * d_col] == letter
+            for k, letter in enumerate(word)
+        )
+        for row in range(grid.height)
+        for col in range(grid.width)
+        for d_row, d_col in ALL_DIRECTIONS
+    )
+
+
+def random_grid(rng: random.Random, height: int = 0, width: int = 0) -> Grid:
+    """
+    Build a grid of random X, M, A and S letters, 1 to 8 cells a side unless given.
+    """
+    height = height or rng.randrange(1, 9)
+    width = width or rng.randrange(1, 9)
+    return Grid(["".join(rng.choice("XMAS") for _ in range(width)) for _ in range(height)])
+
+
+def grid_lines(grid: Grid) -> list[str]:
+    """
+    Return the rows of the grid as strings.
+    """
+    return [grid.row(row).tobytes().decode() for row in range(grid.height)]
+
+
 def test_part_one() -> None:
     """
     Test function for part_one.
@@ -42,3 +93,150 @@ def test_part_two() -> None:
     """
     assert part_two(example_data) == 9
     assert part_two(get_lines("day04")) == 2003
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (18, 9)
+    assert solve(get_lines("day04")) == (2549, 2003)
+
+
+def test_numpy_backend() -> None:
+    """
+    Test function for the NumPy backend.
+
+    This function tests the masked word search against walking the grid
+
+    Returns:
+        None
+    """
+    pytest.importorskip("numpy")
+    assert part_one_numpy(example_data) == 18
+    assert part_one_numpy(get_lines("day04")) == 2549
+    assert part_two_numpy(example_data) == 9
+    assert part_two_numpy(get_lines("day04")) == 2003
+
+    rng = random.Random(20)
+    for _ in range(50):
+        grid = random_grid(rng)
+        for word in ("XMAS", "MAS", "SAS", "X", "XMASXMASX"):
+            assert count_word_numpy(grid, word) == walk(grid, word)
+    assert not count_word_numpy(Grid(example_data), "")
+
+
+def test_count_words() -> None:
+    """
+    Test function for count_words.
+
+    This function tests the single pass multi-word search against walking the grid
+
+    Returns:
+        None
+    """
+    assert count_words(Grid(example_data), ["XMAS"]) == {"XMAS": 18}
+    assert count_words(Grid(get_lines("day04")), ["XMAS", "MAS"])["XMAS"] == 2549
+
+    words = ["XMAS", "MAS", "SAS", "AM", "X", "XMASXMASX", "SAMXMAS", ""]
+    rng = random.Random(21)
+    for _ in range(50):
+        grid = random_grid(rng)
+        assert count_words(grid, words) == {word: walk(grid, word) if word else 0 for word in words}
+
+
+def test_count_template_numpy() -> None:
+    """
+    Test function for count_template_numpy.
+
+    This function tests the template matcher against the word searches and the X-MAS count
+
+    Returns:
+        None
+    """
+    pytest.importorskip("numpy")
+    assert len(template_variants(X_MAS_TEMPLATE)) == 4
+    assert len(template_variants(["XMAS"])) == 4
+    with pytest.raises(ValueError):
+        template_variants(["XM", "A"])
+
+    diagonal = ["X...", ".M..", "..A.", "...S"]
+    rng = random.Random(22)
+    for _ in range(50):
+        grid = random_grid(rng)
+        assert count_template_numpy(grid, ["XMAS"]) + count_template_numpy(
+            grid, diagonal
+        ) == walk(grid, "XMAS")
+        assert count_template_numpy(grid, ["XMAS"], transform=False) == sum(
+            row.count(b"XMAS") for row in grid.lines(0, 1)
+        )
+    assert count_template_numpy(Grid(example_data), X_MAS_TEMPLATE) == 9
+
+
+def test_bitboard() -> None:
+    """
+    Test function for the bitboard engine.
+
+    This function tests that the shifted letter masks give the same counts as the default search
+
+    Returns:
+        None
+    """
+    assert solve_bitboard(example_data) == (18, 9)
+    assert solve_bitboard(get_lines("day04")) == (2549, 2003)
+    assert solve_bitboard([]) == (0, 0)
+
+    rng = random.Random(23)
+    for _ in range(50):
+        grid = random_grid(rng)
+        assert solve_bitboard(grid_lines(grid)) == solve(grid_lines(grid))
+        for word in ("MAS", "SAS", "X", "XMASXMASX"):
+            assert count_word_bitboard(grid, word) == walk(grid, word)
+
+
+def test_solve_parallel() -> None:
+    """
+    Test function for solve_parallel.
+
+    This function tests that matches across the stripe boundaries are counted exactly once
+
+    Returns:
+        None
+    """
+    assert solve_parallel(example_data, jobs=2) == (18, 9)
+    assert solve_parallel(get_lines("day04"), jobs=2) == (2549, 2003)
+    assert solve_parallel([], jobs=2) == (0, 0)
+
+    rng = random.Random(24)
+    lines = grid_lines(random_grid(rng, 37, 30))
+    for jobs in (1, 3, 7):
+        assert solve_parallel(lines, jobs) == solve(lines)
+
+
+def test_word_search_index() -> None:
+    """
+    Test function for WordSearchIndex.
+
+    This function tests that the counts kept through random edits match a full recount
+
+    Returns:
+        None
+    """
+    index = WordSearchIndex(example_data)
+    assert (index.xmas_count, index.x_mas_count) == (18, 9)
+
+    rng = random.Random(25)
+    for _ in range(300):
+        row, col = rng.randrange(index.grid.height), rng.randrange(index.grid.width)
+        index.set_cell(row, col, rng.choice("XMAS."))
+        assert (index.xmas_count, index.x_mas_count) == solve(grid_lines(index.grid))
+
+    index.set_cells((row, col, ".") for row in range(10) for col in range(10))
+    assert (index.xmas_count, index.x_mas_count) == (0, 0)
+    with pytest.raises(ValueError):
+        index.set_cell(10, 0, "X")
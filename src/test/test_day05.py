@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Unit tests for day 5 tasks"""
 
 from src.util import get_lines
-from ..day05 import part_one, part_two
+from ..day05 import part_one, part_two, solve
 
 
 example_data = """47|53
@@ -61,3 +61,16 @@ def test_part_two() -> None:
     """
     assert part_two(example_data) == 123
     assert part_two(get_lines("day05")) == 4077
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (143, 123)
+    assert solve(get_lines("day05")) == (5129, 4077)
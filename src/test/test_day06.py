@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Unit tests for day 6 tasks"""
 
 from src.util import get_lines
-from ..day06 import part_one, part_two
+from ..day06 import part_one, part_two, solve
 
 
 example_data = """....#.....
@@ -43,3 +43,15 @@ def test_part_two() -> None:
     assert part_two(example_data) == 6
     # this is a bit slow with actual input
     # assert part_two(get_lines("day06")) == 1309
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (41, 6)
@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Unit tests for day 7 tasks"""
 
-from src.util import get_lines
-from ..day07 import part_one, part_two
+from src.util import get_lines, iter_lines
+from ..day07 import part_one, part_two, solve
 
 
 example_data = """190: 10 19
@@ -28,6 +28,7 @@ def test_part_one() -> None:
     """
     assert part_one(example_data) == 3749
     assert part_one(get_lines("day07")) == 6083020304036
+    assert part_one(iter_lines("day07")) == 6083020304036
 
 
 def test_part_two() -> None:
@@ -42,3 +43,15 @@ def test_part_two() -> None:
     assert part_two(example_data) == 11387
     # this is a bit slow with actual input
     # assert part_two(get_lines("day07")) == 59002246504791
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (3749, 11387)
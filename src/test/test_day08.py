@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Unit tests for day 8 tasks"""
 
 from src.util import get_lines
-from ..day08 import part_one, part_two
+from ..day08 import part_one, part_two, solve
 
 
 example_data = """............
@@ -86,3 +86,16 @@ def test_part_two() -> None:
     assert part_two(example_data4) == 9
     assert part_two(example_data) == 34
     assert part_two(get_lines("day08")) == 1190
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (14, 34)
+    assert solve(get_lines("day08")) == (329, 1190)
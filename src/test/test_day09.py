@@ -1,7 +1,7 @@
 """Advent of Code 2024 - Unit tests for day 9 tasks"""
 
 from src.util import get_lines
-from ..day09 import part_one, part_two
+from ..day09 import part_one, part_two, solve
 
 
 example_data = """2333133121414131402""".split("\n")
@@ -31,3 +31,15 @@ def test_part_two() -> None:
     """
     assert 1
     # assert part_two(get_lines("day09")) == 1190
+
+
+def test_solve() -> None:
+    """
+    Test function for solve.
+
+    This function tests the implementation of the solve function by asserting the expected output
+
+    Returns:
+        None
+    """
+    assert solve(example_data) == (1928, 1)
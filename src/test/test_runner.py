@@ -0,0 +1,86 @@
+"""Advent of Code 2024 - Unit tests for the runner"""
+
+import argparse
+from pathlib import Path
+
+import pytest
+
+from src import util
+
+from ..runner import main, measure_import_times, parse_numbers, run_task
+
+
+def test_parse_numbers() -> None:
+    """
+    Test function for parse_numbers.
+
+    This function tests that numbers and ranges are expanded, sorted and deduplicated
+
+    Returns:
+        None
+    """
+    assert parse_numbers("1-3,5") == [1, 2, 3, 5]
+    assert parse_numbers("2,1,2") == [1, 2]
+    for value in ("1-x", "3-1", "", "1-2-3"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_numbers(value)
+
+
+def test_run_task() -> None:
+    """
+    Test function for run_task.
+
+    This function tests that a task returns its day, part and answer
+
+    Returns:
+        None
+    """
+    assert run_task(1, 1)[:3] == (1, 1, 1889772)
+    assert run_task(1, 2)[:3] == (1, 2, 23228917)
+
+
+def test_run_task_parse_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for run_task on a day with a parser version.
+
+    This function tests that both parts of the day share one entry of the parse cache
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(util, "PARSE_CACHE_DIR", str(tmp_path))
+    assert run_task(5, 1)[:3] == (5, 1, 5129)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert run_task(5, 2)[:3] == (5, 2, 4077)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_measure_import_times() -> None:
+    """
+    Test function for measure_import_times.
+
+    This function tests that the day module is measured and the lazy imports stay lazy
+
+    Returns:
+        None
+    """
+    imports = measure_import_times("src.day05")
+    assert imports[-1][0] == "src.day05"
+    assert imports[-1][3] >= max(item[3] for item in imports[:-1])
+    assert not {"hashlib", "json", "pickle"} & {item[0] for item in imports}
+
+
+def test_main_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test function for the argument checks of main.
+
+    This function tests that invalid options exit with a usage error instead of a traceback
+
+    Returns:
+        None
+    """
+    for argv in (["--jobs", "0"], ["--jobs", "-2"], ["--parts", "3"]):
+        with pytest.raises(SystemExit) as error:
+            main(argv)
+        assert error.value.code == 2
+    assert "jobs must be at least 1" in capsys.readouterr().err
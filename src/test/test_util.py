@@ -0,0 +1,136 @@
+"""Advent of Code 2024 - Unit tests for utility functions"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src import util
+from src.util import Grid, chunk_ranges, get_input_path, get_lines, iter_chunk_lines, iter_lines
+from .test_day07 import example_data
+from ..day07 import part_one
+
+
+def test_iter_lines() -> None:
+    """
+    Test function for iter_lines.
+
+    This function tests that the streamed lines match the ones read by get_lines
+
+    Returns:
+        None
+    """
+    assert list(iter_lines("day05")) == get_lines("day05")
+    assert list(iter_lines("day05", as_bytes=True)) == [
+        line.encode("utf-8") for line in get_lines("day05")
+    ]
+
+
+def test_chunk_ranges(tmp_path: Path) -> None:
+    """
+    Test function for chunk_ranges.
+
+    This function tests that the lines of the ranges add up to the lines of the whole file
+
+    Returns:
+        None
+    """
+    file_path = get_input_path("day02")
+    for count in (1, 2, 7, 100):
+        ranges = chunk_ranges(file_path, count)
+        assert 1 <= len(ranges) <= count
+        assert [
+            line for start, stop in ranges for line in iter_chunk_lines(file_path, start, stop)
+        ] == list(iter_lines("day02", as_bytes=True))
+
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert not chunk_ranges(str(tmp_path / "empty.txt"), 4)
+    (tmp_path / "short.txt").write_bytes(b"1 2\n3 4")
+    assert chunk_ranges(str(tmp_path / "short.txt"), 4) == [(0, 4), (4, 7)]
+    assert chunk_ranges(str(tmp_path / "short.txt"), 4, split_lines=False) == [
+        (0, 1), (1, 3), (3, 5), (5, 7)
+    ]
+    assert chunk_ranges(str(tmp_path / "short.txt"), 10, split_lines=False) == [
+        (k, k + 1) for k in range(7)
+    ]
+
+
+def test_get_parsed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test function for get_parsed.
+
+    This function tests that parsed inputs are cached per parser version
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(util, "PARSE_CACHE_DIR", str(tmp_path))
+    calls: list[int] = []
+
+    def count_lines(lines: list[str]) -> int:
+        calls.append(1)
+        return len(lines)
+
+    assert util.get_parsed("day01", count_lines, 1) == 1000
+    assert util.get_parsed("day01", count_lines, 1) == 1000
+    assert len(calls) == 1
+    assert util.get_parsed("day01", count_lines, 2) == 1000
+    assert len(calls) == 2
+
+    # The same parser run from another module, e.g. as a script, keeps its own entry
+    count_lines.__module__ = "__main__"
+    assert util.get_parsed("day01", count_lines, 2) == 1000
+    assert len(calls) == 3
+    count_lines.__module__ = __name__
+    assert util.get_parsed("day01", count_lines, 2) == 1000
+    assert len(calls) == 3
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_record_phases() -> None:
+    """
+    Test function for record_phases.
+
+    This function tests that phases are only timed while recording
+
+    Returns:
+        None
+    """
+    with util.phase("untimed"):
+        pass
+    with util.record_phases() as timings:
+        part_one(example_data)
+        part_one(example_data)
+    with util.phase("untimed"):
+        pass
+    assert set(timings) == {"day07.parse", "day07.form_expressions", "day07.has_valid_expression"}
+    assert timings["day07.parse"][1] == 2 * len(example_data)
+    assert json.loads(util.phase_report(timings))["day07.parse"]["calls"] == 18
+
+
+def test_grid() -> None:
+    """
+    Test function for Grid.
+
+    This function tests the indexing, views, rays and lines of a small grid
+
+    Returns:
+        None
+    """
+    grid = Grid(["abc", "def"])
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[1, 2] == "f"
+    assert grid.position(grid.index(1, 2)) == (1, 2)
+    assert bytes(grid.row(1)) == b"def"
+    assert list(grid.find("e")) == [(1, 1)]
+    assert sorted(grid.neighbours(0, 0)) == [(0, 1), (1, 0)]
+    assert grid.ray(1, 2, -1, -1) == b"fb"
+    assert list(grid.lines(1, 0)) == [b"ad", b"be", b"cf"]
+    assert list(grid.lines(1, -1)) == [b"a", b"bd", b"ce", b"f"]
+
+    copy = grid.copy()
+    copy[0, 0] = "x"
+    assert grid[0, 0] == "a"
+    assert Grid(["ab", "c"], fill=b".")[1, 1] == "."
+    with pytest.raises(ValueError):
+        Grid(["ab", "c"])
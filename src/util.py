@@ -1,6 +1,32 @@
 """ Utility functions for the project """
 
+import atexit
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+import importlib
+import mmap
 import os
+import sys
+import time
+from types import ModuleType
+from typing import Literal, TypeVar, overload
+
+# Modules used only by the parse cache, the phase report and the chunked parallel modes
+# (hashlib, pickle, json, concurrent.futures) are imported when first needed, so that
+# one-shot runs of a day do not pay for them at startup.
+
+T = TypeVar("T")
+
+CHUNKS_PER_JOB = 4
+
+PARSE_CACHE_DIR = os.path.dirname(os.path.abspath(__file__)) + "/.parse_cache"
+
+
+def get_input_path(file_name: str) -> str:
+    """
+    Return the absolute path of the named input file in the inputs directory.
+    """
+    return os.path.dirname(os.path.abspath(__file__)) + "/inputs/" + file_name + ".txt"
 
 
 def get_lines(file_name: str) -> list[str]:
@@ -10,6 +36,380 @@ def get_lines(file_name: str) -> list[str]:
     Returns:
         list: A list of strings representing the lines from the input file.
     """
-    file_path = os.path.dirname(os.path.abspath(__file__)) + "/inputs/" + file_name + ".txt"
-    with open(file_path, "r", encoding="utf-8") as file:
+    with open(get_input_path(file_name), "r", encoding="utf-8") as file:
         return list(map(str.strip, file.readlines()))
+
+
+@overload
+def iter_lines(file_name: str, as_bytes: Literal[False] = False) -> Iterator[str]: ...
+
+
+@overload
+def iter_lines(file_name: str, as_bytes: Literal[True]) -> Iterator[bytes]: ...
+
+
+def iter_lines(file_name: str, as_bytes: bool = False) -> Iterator[str] | Iterator[bytes]:
+    """
+    Memory-map the input file and yield its stripped lines one at a time.
+
+    Unlike get_lines, the file is never read into memory as a whole, so inputs
+    larger than the available RAM can be streamed through the day solutions.
+
+    Args:
+        file_name (str): The name of the input file without the extension.
+        as_bytes (bool): Yield the raw bytes of each line instead of decoding them.
+
+    Returns:
+        Iterator: The lines of the input file as str, or as bytes if requested.
+    """
+    if as_bytes:
+        return _iter_mapped_lines(get_input_path(file_name))
+    return (line.decode("utf-8") for line in _iter_mapped_lines(get_input_path(file_name)))
+
+
+def iter_chunk_lines(file_path: str, start: int, stop: int) -> Iterator[bytes]:
+    """
+    Memory-map the file and yield the stripped lines starting within a byte range.
+
+    Args:
+        file_path (str): The path of the file.
+        start (int): The offset of the first line, just after a newline or 0.
+        stop (int): The offset where the range ends, as returned by chunk_ranges.
+
+    Returns:
+        Iterator: The lines of the range as bytes.
+    """
+    return _iter_mapped_lines(file_path, start, stop)
+
+
+def chunk_ranges(file_path: str, count: int, split_lines: bool = True) -> list[tuple[int, int]]:
+    """
+    Split the file into at most count byte ranges of about the same size.
+
+    By default each range ends just after a newline, or at the end of the file, so that no
+    line is split between two ranges and the ranges can be processed independently.
+
+    Args:
+        file_path (str): The path of the file.
+        count (int): The number of ranges wanted.
+        split_lines (bool): End the ranges at newlines. If False, split at plain byte
+            offsets, for files whose records are not lines, e.g. a single line memory dump.
+
+    Returns:
+        list: The (start, stop) offsets of the ranges, in order.
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return []
+        if not split_lines:
+            bounds = sorted({size * k // count for k in range(count)})
+        else:
+            bounds = [0]
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for k in range(1, count):
+                    newline = mapped.find(b"\n", max(size * k // count, bounds[-1]))
+                    if newline == -1 or newline + 1 >= size:
+                        break
+                    bounds.append(newline + 1)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def map_chunks(
+    function: Callable[..., T],
+    file_path: str,
+    jobs: int | None = None,
+    args: tuple[object, ...] = (),
+    split_lines: bool = True,
+) -> list[T]:
+    """
+    Split the file with chunk_ranges and process the ranges in a pool of worker processes.
+
+    The file is split into CHUNKS_PER_JOB ranges per worker, so that a slow range does not
+    leave the other workers idle at the end.
+
+    Args:
+        function (Callable): Called as function(file_path, start, stop, *args) for each range.
+        file_path (str): The path of the file.
+        jobs (int): The number of worker processes, by default one per CPU.
+        args (tuple): Extra arguments passed to the function after the range.
+        split_lines (bool): Whether the ranges must end at a newline, see chunk_ranges.
+
+    Returns:
+        list: The results of the ranges, in the order of the ranges in the file.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    jobs = jobs or os.cpu_count() or 1
+    ranges = chunk_ranges(file_path, jobs * CHUNKS_PER_JOB, split_lines)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(function, file_path, start, stop, *args) for start, stop in ranges
+        ]
+        return [future.result() for future in futures]
+
+
+def _iter_mapped_lines(file_path: str, start: int = 0, stop: int = -1) -> Iterator[bytes]:
+    with open(file_path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if stop == -1:
+                stop = len(mapped)
+            mapped.seek(start)
+            while mapped.tell() < stop:
+                yield mapped.readline().strip()
+
+
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL_DIRECTIONS = ((-1, 1), (1, 1), (1, -1), (-1, -1))
+ALL_DIRECTIONS = DIRECTIONS + DIAGONAL_DIRECTIONS
+
+
+class Grid:
+    """
+    A rectangular grid of characters stored row by row in a single bytearray.
+
+    The cell at (row, col) is cells[row * width + col]. Cells are single bytes, so the
+    grid takes one byte per cell and rows, columns and diagonals are plain slices.
+    """
+
+    def __init__(self, lines: Iterable[str | bytes], fill: bytes | None = None) -> None:
+        """
+        Build the grid from its lines.
+
+        Args:
+            lines (Iterable): The rows of the grid as str or bytes.
+            fill (bytes): Pad shorter rows with this byte instead of rejecting them.
+
+        Raises:
+            ValueError: If the rows differ in length and no fill is given.
+        """
+        rows = [line.encode("ascii") if isinstance(line, str) else line for line in lines]
+        self.height = len(rows)
+        self.width = max(map(len, rows), default=0)
+        if fill is None:
+            if any(len(row) != self.width for row in rows):
+                raise ValueError("all the rows of a grid must have the same length")
+            self.cells = bytearray().join(rows)
+        else:
+            self.cells = bytearray().join(row.ljust(self.width, fill) for row in rows)
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        return chr(self.cells[position[0] * self.width + position[1]])
+
+    def __setitem__(self, position: tuple[int, int], char: str) -> None:
+        self.cells[position[0] * self.width + position[1]] = ord(char)
+
+    def copy(self) -> "Grid":
+        """
+        Return a copy of the grid that can be modified independently.
+        """
+        grid = Grid([])
+        grid.width, grid.height, grid.cells = self.width, self.height, self.cells.copy()
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Return the index of the cell in cells.
+        """
+        return row * self.width + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Return the (row, col) of the cell at the index of cells.
+        """
+        return divmod(index, self.width)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """
+        Check if the given row and column are within the grid.
+        """
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def row(self, row: int) -> memoryview:
+        """
+        Return a view of the row without copying it.
+        """
+        return memoryview(self.cells)[row * self.width:(row + 1) * self.width]
+
+    def find(self, char: str) -> Iterator[tuple[int, int]]:
+        """
+        Yield the positions of all the cells holding the character, row by row.
+        """
+        value = ord(char)
+        index = self.cells.find(value)
+        while index != -1:
+            yield divmod(index, self.width)
+            index = self.cells.find(value, index + 1)
+
+    def neighbours(
+        self, row: int, col: int, directions: Iterable[tuple[int, int]] = DIRECTIONS
+    ) -> Iterator[tuple[int, int]]:
+        """
+        Yield the positions next to the cell in the given directions that are within the grid.
+        """
+        for d_row, d_col in directions:
+            if self.in_bounds(row + d_row, col + d_col):
+                yield row + d_row, col + d_col
+
+    def ray(self, row: int, col: int, d_row: int, d_col: int) -> bytes:
+        """
+        Return the cells from (row, col) stepping by (d_row, d_col) until leaving the grid.
+        """
+        if not self.in_bounds(row, col):
+            return b""
+        steps = self.height + self.width
+        if d_row:
+            steps = min(steps, (self.height - 1 - row) // d_row if d_row > 0 else row // -d_row)
+        if d_col:
+            steps = min(steps, (self.width - 1 - col) // d_col if d_col > 0 else col // -d_col)
+        start = self.index(row, col)
+        if not steps:
+            return bytes(self.cells[start:start + 1])
+        stride = d_row * self.width + d_col
+        stop = start + (steps + 1) * stride
+        return bytes(self.cells[start:stop if stop >= 0 else None:stride])
+
+    def lines(self, d_row: int, d_col: int) -> Iterator[bytes]:
+        """
+        Yield every full line of the grid in the direction, e.g. all the rows for (0, 1).
+
+        Each line starts from a cell whose previous cell in the direction is outside the grid.
+        """
+        if not self.cells:
+            return
+        border = {(row, col) for row in range(self.height) for col in (0, self.width - 1)}
+        border.update((row, col) for row in (0, self.height - 1) for col in range(self.width))
+        for row, col in sorted(border):
+            if not self.in_bounds(row - d_row, col - d_col):
+                yield self.ray(row, col, d_row, d_col)
+
+
+def get_parsed(file_name: str, parser: Callable[[list[str]], T], version: int) -> T:
+    """
+    Parse the input file with the given parser, reusing an earlier result when possible.
+
+    Parsed structures are pickled to PARSE_CACHE_DIR under a key built from the SHA-256
+    of the input file, the parser module and name and the parser version. Changing the
+    input or bumping the version of the parser therefore never returns a stale result.
+    The module tells apart a day run as a script, whose pickles refer to util, from the
+    same day run as part of the src package, whose pickles refer to src.util.
+
+    Args:
+        file_name (str): The name of the input file without the extension.
+        parser (Callable): Function turning the lines of the input into the parsed structure.
+        version (int): Version of the parser, to be bumped whenever its output changes.
+
+    Returns:
+        The parsed structure, either loaded from the cache or freshly parsed.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+    import pickle  # pylint: disable=import-outside-toplevel
+
+    file_path = get_input_path(file_name)
+    with open(file_path, "rb") as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+    parser_name = f"{parser.__module__}.{parser.__qualname__}"
+    cache_path = f"{PARSE_CACHE_DIR}/{file_name}-{parser_name}-v{version}-{digest}.pickle"
+
+    try:
+        with open(cache_path, "rb") as cache_file:
+            parsed: T = pickle.load(cache_file)
+            return parsed
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    parsed = parser(get_lines(file_name))
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    # Write to a temporary file first so that concurrent runs never see a partial pickle
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as temp_file:
+        pickle.dump(parsed, temp_file, pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return parsed
+
+
+# Stack of the active recordings, each mapping a phase name to its seconds and calls
+_phase_recordings: list[dict[str, tuple[float, int]]] = []
+
+
+_DISABLED_PHASE = nullcontext()
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """
+    Time the enclosed block as the named phase if phase recording is enabled.
+
+    Recording is enabled by the AOC_PHASE_TIMINGS environment variable or by the
+    record_phases context manager. While it is off this returns a shared no-op
+    context manager, so instrumented code pays only for the function call.
+    """
+    if not _phase_recordings:
+        return _DISABLED_PHASE
+    return _timed_phase(name, _phase_recordings[-1])
+
+
+@contextmanager
+def _timed_phase(name: str, timings: dict[str, tuple[float, int]]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds, calls = timings.get(name, (0.0, 0))
+        timings[name] = (seconds + time.perf_counter() - start, calls + 1)
+
+
+@contextmanager
+def record_phases() -> Iterator[dict[str, tuple[float, int]]]:
+    """
+    Record the phases timed within the block into a fresh dictionary.
+
+    Yields:
+        dict: Phase names mapped to their total seconds and number of calls.
+    """
+    timings: dict[str, tuple[float, int]] = {}
+    _phase_recordings.append(timings)
+    try:
+        yield timings
+    finally:
+        _phase_recordings.pop()
+
+
+def phase_report(timings: dict[str, tuple[float, int]]) -> str:
+    """
+    Format phase timings as JSON, the most expensive phase first.
+    """
+    import json  # pylint: disable=import-outside-toplevel
+
+    ordered = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)
+    return json.dumps(
+        {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in ordered}
+    )
+
+
+def _print_phase_report(timings: dict[str, tuple[float, int]]) -> None:
+    if timings:
+        print(phase_report(timings), file=sys.stderr)
+
+
+if os.environ.get("AOC_PHASE_TIMINGS"):
+    _phase_recordings.append({})
+    atexit.register(_print_phase_report, _phase_recordings[0])
+
+
+def import_backend(module_name: str, feature: str) -> ModuleType:
+    """
+    Import an optional dependency the first time a feature using it is selected.
+
+    Keeping heavy third party modules out of the module level imports means that they
+    cost nothing at startup unless the backend needing them is actually used.
+
+    Raises:
+        ImportError: If the module is not installed, naming the feature that needs it.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as error:
+        raise ImportError(f"{feature} requires {module_name}, which is not installed") from error